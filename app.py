@@ -19,9 +19,11 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import re
 import time
 import datetime
 import threading
+import numpy as np
 import streamlit as st
 from streamlit_folium import st_folium
 from streamlit_autorefresh import st_autorefresh
@@ -41,9 +43,10 @@ st.set_page_config(
 
 # ── Internal imports ──────────────────────────────────────────────────────────
 from config import settings
-from data_sources.aviation import fetch_aircraft, check_aviation_anomalies
+from data_sources import aviation_worker
+from data_sources.aviation import EMERGENCY_SQUAWKS
 from data_sources.cameras import get_all_cameras
-from ui.map_view import build_map
+from ui.map_view import build_map, aircraft_geojson
 from ui.camera_grid import render_camera_grid, render_add_camera_form
 from ui.satellite_view import render_satellite_panel
 from ui.alerts_panel import render_alerts_panel
@@ -52,6 +55,8 @@ from utils.logger import get_logger
 
 log = get_logger(__name__)
 
+_UTC = datetime.timezone.utc
+
 
 # ── DEBUG HELPER ──────────────────────────────────────────────────────────────
 def _debug_opensky():
@@ -100,19 +105,20 @@ def _debug_opensky():
 
 
 # ── Global CSS ────────────────────────────────────────────────────────────────
-def inject_css():
-    st.markdown("""
+# Streamlit removes any element a rerun doesn't re-emit, so the stylesheet has
+# to be sent every run — build it once at import, whitespace collapsed.
+_CSS = re.sub(r"\s+", " ", """
     <style>
     .main { background-color: #0d1117; }
-    .stTabs [data-baseweb="tab-list"] { gap: 8px; }
-    .stTabs [data-baseweb="tab"] {
+    .stRadio [role="radiogroup"] { gap: 8px; }
+    .stRadio [role="radiogroup"] > label {
         background-color: #161b22;
         border-radius: 6px 6px 0 0;
         border: 1px solid #30363d;
         color: #8b949e;
         padding: 8px 20px;
     }
-    .stTabs [aria-selected="true"] {
+    .stRadio [role="radiogroup"] > label:has(input:checked) {
         background-color: #1f6feb !important;
         color: white !important;
     }
@@ -132,7 +138,11 @@ def inject_css():
     ::-webkit-scrollbar-track { background: #0d1117; }
     ::-webkit-scrollbar-thumb { background: #30363d; border-radius: 3px; }
     </style>
-    """, unsafe_allow_html=True)
+""").strip()
+
+
+def inject_css():
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 
 # ── Session state initialisation ──────────────────────────────────────────────
@@ -159,6 +169,8 @@ def load_detector():
     try:
         from vision.detector import YOLODetector
         detector = YOLODetector.get_instance()
+        # Prime the batched camera-grid shape so the first real frame doesn't stall
+        detector.warmup(batch_size=settings.CAMERA_GRID_MAX)
         log.info(f"Detector ready: {detector.device_info}")
         return detector
     except Exception as e:
@@ -167,13 +179,52 @@ def load_detector():
 
 
 # ── Aviation data fetcher ─────────────────────────────────────────────────────
-@st.cache_data(ttl=settings.CACHE_TTL_AVIATION, show_spinner=False)
+@st.cache_resource(show_spinner=False)
+def start_aviation_worker():
+    return aviation_worker.start()
+
+
 def get_aircraft_data():
-    aircraft, is_live = fetch_aircraft()
-    anomalies = check_aviation_anomalies(aircraft)
-    for a in anomalies:
-        dispatch_alert(a["level"], "Aviation Anomaly", a["message"])
-    return aircraft, is_live, anomalies
+    start_aviation_worker()
+    aircraft, columns, is_live, anomalies, fetched_at, payload = aviation_worker.get_snapshot()
+    return aircraft, columns, is_live, anomalies, fetched_at, payload
+
+
+# ── Map builder (cached) ──────────────────────────────────────────────────────
+# Leading-underscore arguments are skipped by Streamlit's hasher; the cheap
+# keys in front of them describe everything that visibly changes the map.
+@st.cache_resource(ttl=settings.CACHE_TTL_AVIATION, max_entries=4, show_spinner=False)
+def get_world_map(
+    aircraft_key: int,
+    camera_key: tuple,
+    _aircraft_list,
+    _aircraft_cols,
+    _cameras,
+    _camera_status,
+    **map_options,
+):
+    return build_map(
+        aircraft_geojson=aircraft_geojson(_aircraft_list, _aircraft_cols),
+        cameras=_cameras,
+        camera_status=_camera_status,
+        **map_options,
+    )
+
+
+def _aircraft_map_key(aircraft_list, cols: dict) -> int:
+    """
+    Hash of everything the aircraft layer draws: rounded positions (~100 m is
+    plenty at world zoom) plus each popup, which carries the id, callsign,
+    status, squawk, altitude, speed and heading shown in popups and tooltips.
+    """
+    layout = np.round(np.stack([cols["lat"], cols["lon"]]), 3)
+    return hash((layout.tobytes(), tuple(ac.popup_html for ac in aircraft_list)))
+
+
+def _camera_map_key(cameras: list[dict], camera_status: dict) -> tuple:
+    return tuple(
+        (c["id"], camera_status.get(c["id"], {}).get("online")) for c in cameras
+    )
 
 
 # ── Sidebar ───────────────────────────────────────────────────────────────────
@@ -230,7 +281,7 @@ def render_sidebar(all_cameras: list[dict]) -> dict:
                 sat_date = st.date_input(
                     "Date", value=_dt.date.today() - _dt.timedelta(days=2)
                 )
-                sat_date_str = sat_date.strftime("%Y-%m-%d")
+                sat_date_str = sat_date.isoformat()
             else:
                 sat_overlay_id = ""
                 sat_date_str = ""
@@ -302,21 +353,36 @@ def render_sidebar(all_cameras: list[dict]) -> dict:
 
 
 # ── Header banner ─────────────────────────────────────────────────────────────
-def render_header(aircraft_count: int, is_live: bool, camera_count: int):
-    now_utc = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    live_badge = '<span class="status-live">● LIVE</span>' if is_live else '<span class="status-mock">● SIMULATED</span>'
-
-    st.markdown(f"""
+HEADER_TMPL = """
     <div class="aetherwatch-header">
       <table style="width:100%; border-collapse:collapse">
         <tr>
           <td style="font-size:20px; font-weight:bold; color:#58a6ff">🛰️ AetherWatch</td>
           <td style="text-align:center; color:#8b949e">✈️ {aircraft_count} Aircraft &nbsp;|&nbsp; 📷 {camera_count} Cameras &nbsp;|&nbsp; 🤖 YOLO Active</td>
-          <td style="text-align:right; font-size:12px; color:#8b949e">{live_badge} &nbsp; {now_utc}</td>
+          <td style="text-align:right; font-size:12px; color:#8b949e">{badge} &nbsp; {ts}</td>
         </tr>
       </table>
     </div>
-    """, unsafe_allow_html=True)
+    """
+LIVE_BADGE = '<span class="status-live">● LIVE</span>'
+MOCK_BADGE = '<span class="status-mock">● SIMULATED</span>'
+
+
+def render_header(aircraft_count: int, is_live: bool, camera_count: int):
+    st.markdown(HEADER_TMPL.format_map({
+        "aircraft_count": aircraft_count,
+        "camera_count": camera_count,
+        "badge": LIVE_BADGE if is_live else MOCK_BADGE,
+        "ts": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
+    }), unsafe_allow_html=True)
+
+
+# ── Main views ────────────────────────────────────────────────────────────────
+VIEW_MAP = "🗺️ World Map"
+VIEW_CAMERAS = "📷 Camera Grid"
+VIEW_SATELLITE = "🛰️ Satellite"
+VIEW_ALERTS = "🚨 Alerts & Log"
+VIEWS = (VIEW_MAP, VIEW_CAMERAS, VIEW_SATELLITE, VIEW_ALERTS)
 
 
 # ── Main app ──────────────────────────────────────────────────────────────────
@@ -339,7 +405,7 @@ def main():
     st_autorefresh(interval=cfg["refresh_rate"] * 1000, key="dashboard_refresh")
 
     with st.spinner("Fetching aviation data…"):
-        aircraft_list, is_live, av_anomalies = get_aircraft_data()
+        aircraft_list, aircraft_cols, is_live, av_anomalies, fetched_at, aircraft_json = get_aircraft_data()
 
     detector = load_detector() if cfg["detection_enabled"] else None
 
@@ -350,7 +416,7 @@ def main():
         st.metric("✈️ Aircraft", len(aircraft_list),
                   help="Live aircraft tracked globally")
     with m2:
-        airborne = sum(1 for a in aircraft_list if not a.on_ground)
+        airborne = len(aircraft_list) - int(np.count_nonzero(aircraft_cols["on_ground"]))
         st.metric("🛫 Airborne", airborne)
     with m3:
         from utils.alerts import get_recent_alerts
@@ -371,25 +437,31 @@ def main():
         for anom in av_anomalies[:3]:
             st.error(f"🚨 {anom['message']}")
 
-    tab_map, tab_cameras, tab_satellite, tab_alerts = st.tabs([
-        "🗺️ World Map", "📷 Camera Grid", "🛰️ Satellite", "🚨 Alerts & Log"
-    ])
+    # st.tabs would run every tab body on each rerun; a radio lets us build
+    # only the view that is actually on screen
+    active_view = st.radio(
+        "View", VIEWS, horizontal=True, label_visibility="collapsed", key="_active_tab",
+    )
 
-    with tab_map:
+    if active_view == VIEW_MAP:
         st.subheader("✈️ Live World Map")
 
         from data_sources.cameras import get_camera_status
 
-        fmap = build_map(
-            aircraft_list=aircraft_list,
-            cameras=all_cameras,
+        camera_status = get_camera_status()
+        fmap = get_world_map(
+            _aircraft_map_key(aircraft_list, aircraft_cols),
+            _camera_map_key(all_cameras, camera_status),
+            aircraft_list,
+            aircraft_cols,
+            all_cameras,
+            camera_status,
             tile_style=cfg["map_tile"],
             show_aircraft=cfg["show_aircraft"],
             show_cameras=cfg["show_cameras_map"],
             show_satellite_overlay=cfg["show_sat_overlay"],
             satellite_layer=cfg["sat_overlay_id"],
             satellite_date=cfg["sat_date_str"],
-            camera_status=get_camera_status(),
             cluster_aircraft=cfg["cluster_aircraft"],
         )
 
@@ -399,36 +471,54 @@ def main():
             height=550,
             returned_objects=[],
             use_container_width=True,
+            key="world_map",   # stable identity: update the iframe, don't remount it
         )
 
         with st.expander(f"📊 Aircraft Data Table ({len(aircraft_list)} aircraft)", expanded=False):
             import pandas as pd
             if aircraft_list:
-                df = pd.DataFrame([a.to_dict() for a in aircraft_list])
+                df = pd.DataFrame(aircraft_cols)
                 cols_order = ["callsign", "country", "alt_ft", "speed_kts", "heading",
                               "on_ground", "squawk", "type", "lat", "lon"]
                 df = df[[c for c in cols_order if c in df.columns]]
 
-                def highlight_squawk(row):
-                    if row.get("squawk") in ["7700", "7600", "7500"]:
-                        return ["background-color: #3d0000"] * len(row)
-                    return [""] * len(row)
+                # One vectorised mask instead of a Python call per row
+                emergency = np.isin(aircraft_cols["squawk"], list(EMERGENCY_SQUAWKS))
+                row_styles = np.where(emergency, "background-color: #3d0000", "")
 
                 st.dataframe(
-                    df.style.apply(highlight_squawk, axis=1),
+                    df.style.apply(lambda _: row_styles, axis=0),
                     use_container_width=True,
                     hide_index=True,
                 )
 
-                csv = df.to_csv(index=False)
+                # Serialising thousands of rows every refresh is wasted work unless
+                # someone actually wants the file — build it on demand per snapshot
+                csv_key = _aircraft_map_key(aircraft_list, aircraft_cols)
+                if st.button("📄 Prepare CSV export"):
+                    st.session_state["_csv_cache"] = (
+                        csv_key,
+                        df.to_csv(index=False).encode(),
+                        datetime.datetime.now(_UTC).strftime('%Y%m%d_%H%M%S'),
+                    )
+                cached_csv = st.session_state.get("_csv_cache")
+                if cached_csv and cached_csv[0] == csv_key:
+                    st.download_button(
+                        "⬇️ Export Aircraft CSV",
+                        data=cached_csv[1],
+                        file_name=f"aircraft_{cached_csv[2]}.csv",
+                        mime="text/csv",
+                    )
+
+                # Same snapshot as the table; encoded only when first clicked
                 st.download_button(
-                    "⬇️ Export Aircraft CSV",
-                    data=csv,
-                    file_name=f"aircraft_{datetime.datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv",
+                    "⬇️ Export Aircraft JSON",
+                    data=aircraft_json,
+                    file_name=f"aircraft_{datetime.datetime.fromtimestamp(fetched_at, _UTC):%Y%m%d_%H%M%S}.json",
+                    mime="application/json",
                 )
 
-    with tab_cameras:
+    elif active_view == VIEW_CAMERAS:
         new_cam = render_add_camera_form()
         if new_cam:
             st.session_state.custom_cameras.append(new_cam)
@@ -447,13 +537,13 @@ def main():
                 cols=cfg["cam_cols"],
             )
 
-    with tab_satellite:
+    elif active_view == VIEW_SATELLITE:
         render_satellite_panel(
             detector=detector if cfg["detect_satellite"] else None,
             detection_enabled=cfg["detect_satellite"],
         )
 
-    with tab_alerts:
+    elif active_view == VIEW_ALERTS:
         render_alerts_panel()
 
     st.markdown("""
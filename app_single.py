@@ -9,13 +9,19 @@
 # ════════════════════════════════════════════════════════════════════════════════
 # SECTION 0 — IMPORTS & PAGE CONFIG
 # ════════════════════════════════════════════════════════════════════════════════
-import io, os, time, math, random, datetime, threading, smtplib
+import io, os, time, math, random, datetime, threading, smtplib, zlib
+from collections import Counter, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 from email.mime.text import MIMEText
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import pandas as pd
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageFilter
 
 import streamlit as st
 import folium
@@ -23,6 +29,18 @@ import folium.plugins
 from streamlit_folium import st_folium
 from streamlit_autorefresh import st_autorefresh
 
+from utils.jit import njit   # optional numba, imported on first kernel call
+
+try:
+    from orjson import loads as _loads   # several times faster than json on the OpenSky states
+except ImportError:
+    from json import loads as _loads
+
+try:
+    _FONT = ImageFont.load_default()
+except Exception:
+    _FONT = None
+
 try:
     from dotenv import load_dotenv
     load_dotenv()
@@ -43,9 +61,19 @@ NASA_GIBS_WMS     = "https://gibs.earthdata.nasa.gov/wms/epsg4326/best/wms.cgi"
 FORCE_MOCK        = os.getenv("FORCE_MOCK_DATA", "false").lower() == "true"
 DEFAULT_REFRESH   = 30
 YOLO_MODEL        = "yolov8n.pt"
+YOLO_ENGINE       = "yolov8n.engine"
+_HALF_DEVICES     = ("cuda", "mps")
 YOLO_CONF         = 0.35
 MAX_AIRCRAFT      = 400
 API_TIMEOUT       = 10
+SAT_WIDTH         = 512   # GIBS renders server-side at this width; height follows the bbox
+
+# One pooled keep-alive session for OpenSky / cameras / GIBS
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502,503,504]),
+))
 
 SATELLITE_LAYERS = {
     "True Color (MODIS Terra)":  "MODIS_Terra_CorrectedReflectance_TrueColor",
@@ -58,6 +86,13 @@ SATELLITE_LAYERS = {
     "Land Surface Temp":         "MODIS_Terra_Land_Surface_Temp_Day",
 }
 
+# (lon_min, lat_min, lon_max, lat_max) — shared by GIBS and the OpenSky bbox query
+REGIONS = {
+    "Global":(-180,-90,180,90), "North America":(-170,15,-50,80),
+    "Europe":(-30,30,45,75), "Asia Pacific":(60,-15,180,60),
+    "Africa":(-25,-40,60,40), "South America":(-85,-60,-30,15),
+}
+
 PUBLIC_CAMERAS = [
     {"id":"c1","name":"NYC — Broadway & 42nd","url":"https://webcams.nyc.gov/cameras/1.jpg","type":"static","lat":40.756,"lon":-73.986,"city":"New York, USA","description":"Times Square area"},
     {"id":"c2","name":"NYC — 34th & 7th Ave","url":"https://webcams.nyc.gov/cameras/2.jpg","type":"static","lat":40.748,"lon":-73.997,"city":"New York, USA","description":"Penn Station area"},
@@ -77,18 +112,20 @@ PUBLIC_CAMERAS = [
 class AL:
     INFO = "ℹ️ INFO"; WARNING = "⚠️ WARNING"; CRITICAL = "🚨 CRITICAL"; ANOMALY = "🔴 ANOMALY"
 
-_alert_log: list[dict] = []
+_alert_log: deque[dict] = deque(maxlen=150)
+_alert_counts: Counter = Counter()   # level → count, kept in step with _alert_log
 
 def fire_alert(level: str, source: str, msg: str, details: str = "") -> dict:
     record = {"timestamp": datetime.datetime.utcnow().strftime("%H:%M:%S"),
               "level": level, "source": source, "message": msg, "details": details}
+    if len(_alert_log) == _alert_log.maxlen:
+        _alert_counts[_alert_log[0]["level"]] -= 1
     _alert_log.append(record)
-    if len(_alert_log) > 150:
-        _alert_log.pop(0)
+    _alert_counts[level] += 1
     return record
 
 def get_alerts(limit: int = 50) -> list[dict]:
-    return list(reversed(_alert_log[-limit:]))
+    return list(islice(reversed(_alert_log), limit))
 
 # ════════════════════════════════════════════════════════════════════════════════
 # SECTION 3 — AVIATION DATA (OpenSky + Mock)
@@ -97,46 +134,67 @@ _MOCK_AIRLINES = ["UAL","DAL","AAL","SWA","BAW","DLH","AFR","KLM","UAE","QFA","S
 _MOCK_COUNTRIES = ["United States","United Kingdom","Germany","France","Japan","Australia","Canada","Brazil"]
 _MOCK_TYPES = ["B738","A320","B77W","A359","B789","A321","E190","CRJ9","B737","A319"]
 
+# (lat_c, lon_c, lat_sigma, lon_sigma) per flight corridor, with draw weights
+_CORR = np.array([
+    [52,-30,15,40], [48,10,12,30], [37,-95,15,40],
+    [25,120,20,40], [-25,135,20,30], [5,30,20,40],
+], dtype=float)
+_CORR_W = np.array([0.25, 0.20, 0.25, 0.15, 0.10, 0.05])
+_CORR_W /= _CORR_W.sum()
+
 def generate_mock_aircraft(n: int = 180) -> list[dict]:
     """Generate realistic simulated aircraft across major flight corridors."""
-    random.seed(int(time.time() / 60))
-    corridors = [
-        (52,-30,15,40,0.25), (48,10,12,30,0.20), (37,-95,15,40,0.25),
-        (25,120,20,40,0.15), (-25,135,20,30,0.10), (5,30,20,40,0.05),
-    ]
-    aircraft = []
-    for _ in range(n):
-        weights = [c[4] for c in corridors]
-        lat_c,lon_c,lat_s,lon_s,_ = random.choices(corridors, weights=weights)[0]
-        lat = max(-85, min(85, lat_c + random.gauss(0, lat_s)))
-        lon = ((lon_c + random.gauss(0, lon_s) + 180) % 360) - 180
-        airline = random.choice(_MOCK_AIRLINES)
-        alt_ft = max(1000, min(45000, random.gauss(35000, 5000)))
-        aircraft.append({
-            "icao24": f"{random.randint(0,0xFFFFFF):06x}",
-            "callsign": f"{airline}{random.randint(100,9999)}",
-            "country": random.choice(_MOCK_COUNTRIES),
-            "lat": round(lat, 5), "lon": round(lon, 5),
-            "alt_ft": round(alt_ft),
-            "speed_kts": round(random.gauss(470,50) if alt_ft > 10000 else random.gauss(250,50)),
-            "heading": round(random.uniform(0,360)),
+    rng = np.random.default_rng(int(time.time() / 60))
+    cc = _CORR[rng.choice(len(_CORR), n, p=_CORR_W)]
+    lat = np.clip(cc[:,0] + rng.normal(0, cc[:,2]), -85, 85).round(5)
+    lon = (((cc[:,1] + rng.normal(0, cc[:,3]) + 180) % 360) - 180).round(5)
+    alt = np.clip(rng.normal(35000, 5000, n), 1000, 45000)
+    speed = np.where(alt > 10000, rng.normal(470, 50, n), rng.normal(250, 50, n))
+    heading = rng.uniform(0, 360, n)
+    icao = rng.integers(0, 0x1000000, n)
+    flight_no = rng.integers(100, 10000, n)
+    airline = rng.integers(0, len(_MOCK_AIRLINES), n)
+    country = rng.integers(0, len(_MOCK_COUNTRIES), n)
+    ac_type = rng.integers(0, len(_MOCK_TYPES), n)
+    emergency = rng.random(n) < 0.002
+    return [
+        {
+            "icao24": f"{i:06x}",
+            "callsign": f"{_MOCK_AIRLINES[a]}{f}",
+            "country": _MOCK_COUNTRIES[c],
+            "lat": la, "lon": lo,
+            "alt_ft": al, "speed_kts": sp, "heading": hd,
             "on_ground": False,
-            "squawk": "7700" if random.random()<0.002 else "0000",
-            "type": random.choice(_MOCK_TYPES),
+            "squawk": "7700" if em else "0000",
+            "type": _MOCK_TYPES[t],
             "is_mock": True,
-        })
-    return aircraft
+        }
+        for i, f, a, c, la, lo, al, sp, hd, em, t in zip(
+            icao.tolist(), flight_no.tolist(), airline.tolist(), country.tolist(),
+            lat.tolist(), lon.tolist(), np.rint(alt).astype(int).tolist(),
+            np.rint(speed).astype(int).tolist(), np.rint(heading).astype(int).tolist(),
+            emergency.tolist(), ac_type.tolist(),
+        )
+    ]
+
+_EMERG_NAMES = {"7700":"Emergency","7600":"Radio Failure","7500":"Hijack"}
+_EMERG = np.array(list(_EMERG_NAMES))
 
 @st.cache_data(ttl=30, show_spinner=False)
-def fetch_aircraft(opensky_user: str = "", opensky_pass: str = "") -> tuple[list[dict], bool]:
+def fetch_aircraft(opensky_user: str = "", opensky_pass: str = "",
+                   bbox: Optional[tuple] = None) -> tuple[list[dict], bool]:
+    """``bbox`` is a REGIONS-style (lon_min, lat_min, lon_max, lat_max); None = global."""
     if FORCE_MOCK:
         return generate_mock_aircraft(), False
     try:
         auth = (opensky_user, opensky_pass) if opensky_user else None
-        r = requests.get(OPENSKY_URL, auth=auth, timeout=API_TIMEOUT,
+        params = None
+        if bbox:
+            params = {"lomin":bbox[0], "lamin":bbox[1], "lomax":bbox[2], "lamax":bbox[3]}
+        r = _SESSION.get(OPENSKY_URL, params=params, auth=auth, timeout=API_TIMEOUT,
                         headers={"User-Agent":"AetherWatch/1.0"})
         r.raise_for_status()
-        states = r.json().get("states") or []
+        states = _loads(r.content).get("states") or []
         out = []
         for s in states[:MAX_AIRCRAFT]:
             if len(s) < 11 or s[5] is None or s[6] is None: continue
@@ -160,6 +218,8 @@ def fetch_aircraft(opensky_user: str = "", opensky_pass: str = "") -> tuple[list
 # ════════════════════════════════════════════════════════════════════════════════
 _cam_status: dict = {}
 _mock_vehicles: dict = {}
+_bg_cache: dict[tuple, Image.Image] = {}
+_WINDSCREEN = np.array([150,200,255], dtype=np.uint8)
 
 def fetch_camera_frame(cam: dict) -> tuple[Optional[Image.Image], bool]:
     if FORCE_MOCK:
@@ -168,19 +228,26 @@ def fetch_camera_frame(cam: dict) -> tuple[Optional[Image.Image], bool]:
     try:
         headers = {"User-Agent":"Mozilla/5.0","Cache-Control":"no-cache"}
         if cam["type"] == "mjpeg":
-            with requests.get(cam["url"], timeout=6, headers=headers, stream=True) as r:
+            with _SESSION.get(cam["url"], timeout=6, headers=headers, stream=True) as r:
                 r.raise_for_status()
-                buf = b""
+                # bytearray grows in place; each scan covers only the new bytes
+                # (less one, for a marker split across chunks), not the whole buffer
+                buf, s, pos = bytearray(), -1, 0
                 for chunk in r.iter_content(4096):
                     buf += chunk
-                    s, e = buf.find(b'\xff\xd8'), buf.find(b'\xff\xd9')
-                    if s != -1 and e != -1:
-                        img = Image.open(io.BytesIO(buf[s:e+2])).convert("RGB")
-                        _cam_status[cam_id] = {"online": True}
-                        return img, True
+                    if s == -1:
+                        s = buf.find(b'\xff\xd8', pos)
+                        pos = max(len(buf)-1, 0) if s == -1 else s+2
+                    if s != -1:
+                        e = buf.find(b'\xff\xd9', pos)
+                        if e != -1:
+                            img = Image.open(io.BytesIO(buf[s:e+2])).convert("RGB")
+                            _cam_status[cam_id] = {"online": True}
+                            return img, True
+                        pos = max(len(buf)-1, s+2)
                     if len(buf) > 800_000: break
         else:
-            r = requests.get(cam["url"], timeout=6, headers=headers)
+            r = _SESSION.get(cam["url"], timeout=6, headers=headers)
             r.raise_for_status()
             img = Image.open(io.BytesIO(r.content)).convert("RGB")
             _cam_status[cam_id] = {"online": True}
@@ -189,76 +256,128 @@ def fetch_camera_frame(cam: dict) -> tuple[Optional[Image.Image], bool]:
         _cam_status[cam_id] = {"online": False}
     return _mock_frame(cam), False
 
-def _mock_frame(cam: dict, W: int = 640, H: int = 360) -> Image.Image:
-    cid = cam["id"]
-    if cid not in _mock_vehicles:
-        rng = random.Random(hash(cid) % 9999)
-        _mock_vehicles[cid] = [
-            {"x": rng.uniform(50,W-50), "y": rng.uniform(H*0.6,H*0.85),
-             "speed": rng.uniform(0.3,2.0), "color": rng.choice(["#c0392b","#2980b9","#27ae60","#f39c12","#ecf0f1"]),
-             "w": rng.randint(25,55), "lane": rng.randint(0,1)}
-            for _ in range(rng.randint(4,10))
-        ]
-    for v in _mock_vehicles[cid]:
-        d = 1 if v["lane"]==0 else -1
-        v["x"] = (v["x"] + d * v["speed"]) % (W + 160) - 80
+def _timed_fetch(cam: dict) -> tuple[Image.Image, bool, float]:
+    t0 = time.time()
+    img, live = fetch_camera_frame(cam)
+    return img, live, (time.time()-t0)*1000
+
+@st.cache_resource(show_spinner=False)
+def _camera_pool() -> ThreadPoolExecutor:
+    """Created once per server: this script re-runs top to bottom on every refresh."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="camera-fetch")
+
+def _build_static_bg(W: int, H: int) -> Image.Image:
+    """Sky, road and lane markings — identical for every camera of a given size."""
     img = Image.new("RGB", (W,H))
     draw = ImageDraw.Draw(img)
-    for y in range(int(H*0.45)):
-        ratio = y / (H*0.45)
-        r,g,b = int(30+ratio*105), int(100+ratio*85), int(200+ratio*35)
-        draw.line([(0,y),(W,y)], fill=(r,g,b))
+    H_sky = int(H*0.45)
+    ratio = np.arange(H_sky)[:,None] / (H*0.45)
+    sky_rgb = (np.array([30,100,200]) + ratio * np.array([105,85,35])).astype(np.uint8)
+    img.paste(Image.fromarray(np.ascontiguousarray(np.broadcast_to(sky_rgb[:,None,:], (H_sky,W,3)))))
     draw.rectangle([0,int(H*0.45),W,H], fill=(55,55,55))
     draw.rectangle([0,int(H*0.5),W,H], fill=(45,45,45))
     for ly in [int(H*0.63), int(H*0.75)]:
         for x in range(0,W,70):
             draw.rectangle([x,ly,x+40,ly+3], fill=(200,200,120))
-    for v in _mock_vehicles[cid]:
-        x,y,w,h = int(v["x"]),int(v["y"]),v["w"],14
-        draw.rectangle([x,y-h,x+w,y], fill=v["color"])
-        draw.rectangle([x+4,y-h+2,x+w-4,y-h+8], fill=(150,200,255))
+    # Soften once here; per-frame vehicles and banners are drawn crisp on top
+    return img.filter(ImageFilter.GaussianBlur(0.4))
+
+def _init_vehicles(cid: str, W: int = 640, H: int = 360) -> tuple[np.ndarray, np.ndarray]:
+    """Deterministic (crc32-seeded, unlike ``hash``) vehicle state for one camera."""
+    rng = random.Random(zlib.crc32(cid.encode()))
+    vs = [
+        (rng.uniform(50,W-50), rng.uniform(H*0.6,H*0.85), rng.uniform(0.3,2.0),
+         rng.choice(["#c0392b","#2980b9","#27ae60","#f39c12","#ecf0f1"]),
+         rng.randint(25,55), rng.randint(0,1))
+        for _ in range(rng.randint(4,10))
+    ]
+    # SoA state: [x, y, speed, w, lane] per vehicle + a matching RGB colour row
+    return (
+        np.array([(x,y,sp,w,ln) for x,y,sp,_,w,ln in vs], dtype=np.float32),
+        np.array([ImageColor.getrgb(c) for _,_,_,c,_,_ in vs], dtype=np.uint8),
+    )
+
+_mock_vehicles.update((c["id"], _init_vehicles(c["id"])) for c in PUBLIC_CAMERAS)
+
+@njit
+def _step_and_draw(state, pixels, colors):
+    """Advance every vehicle one tick and rasterise body + windscreen into ``pixels``."""
+    H, W = pixels.shape[0], pixels.shape[1]
+    for i in range(state.shape[0]):
+        d = 1.0 if state[i,4] == 0 else -1.0
+        state[i,0] = (state[i,0] + d * state[i,2]) % (W + 160) - 80
+        x, y, w, h = int(state[i,0]), int(state[i,1]), int(state[i,3]), 14
+        # (x0, y0, x1, y1) inclusive, like ImageDraw.rectangle
+        for k in range(2):
+            if k == 0:
+                x0, y0, x1, y1 = x, y-h, x+w, y
+            else:
+                x0, y0, x1, y1 = x+4, y-h+2, x+w-4, y-h+8
+            x0 = max(x0, 0); y0 = max(y0, 0); x1 = min(x1+1, W); y1 = min(y1+1, H)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            for c in range(3):
+                pixels[y0:y1, x0:x1, c] = colors[i,c] if k == 0 else _WINDSCREEN[c]
+
+def _mock_frame(cam: dict, W: int = 640, H: int = 360) -> Image.Image:
+    cid = cam["id"]
+    vehicles = _mock_vehicles.get(cid)
+    if vehicles is None:   # custom cameras added at runtime
+        vehicles = _mock_vehicles[cid] = _init_vehicles(cid, W, H)
+    state, colors = vehicles
+    bg = _bg_cache.get((W,H)) or _bg_cache.setdefault((W,H), _build_static_bg(W,H))
+    pixels = np.array(bg)
+    _step_and_draw(state, pixels, colors)
+    img = Image.fromarray(pixels)
+    draw = ImageDraw.Draw(img)
     draw.rectangle([0,0,W,22], fill=(0,0,0))
-    try: font = ImageFont.load_default()
-    except: font = None
+    font = _FONT
     draw.text((4,5), f"📷 {cam['name']} | {time.strftime('%H:%M:%S')} UTC | ⚠ SIMULATED", fill=(255,80,80), font=font)
     draw.rectangle([0,H-20,W,H], fill=(0,0,0))
     draw.text((4,H-15), f"📍 {cam.get('city','')} — {cam.get('description','')}", fill=(180,180,180), font=font)
-    return img.filter(ImageFilter.GaussianBlur(0.4))
+    return img
 
 # ════════════════════════════════════════════════════════════════════════════════
 # SECTION 5 — NASA GIBS SATELLITE IMAGERY
 # ════════════════════════════════════════════════════════════════════════════════
+def _gibs_get(layer_id: str, date_str: str, bbox: tuple, W: int, H: int) -> Image.Image:
+    params = {"SERVICE":"WMS","VERSION":"1.1.1","REQUEST":"GetMap","LAYERS":layer_id,
+              "STYLES":"","SRS":"EPSG:4326",
+              "BBOX":f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}",
+              "WIDTH":str(W),"HEIGHT":str(H),"FORMAT":"image/jpeg","TIME":date_str}
+    with _SESSION.get(NASA_GIBS_WMS, params=params, timeout=15, stream=True,
+                      headers={"User-Agent":"AetherWatch/1.0"}) as r:
+        r.raise_for_status()
+        if "image" not in r.headers.get("Content-Type",""):
+            raise ValueError("Non-image response")
+        r.raw.decode_content = True
+        img = Image.open(r.raw).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    draw.rectangle([0,0,W,20], fill=(0,0,0))
+    font = _FONT
+    draw.text((4,3), f"🛰 NASA GIBS | {layer_id[:40]} | {date_str}", fill=(80,200,80), font=font)
+    return img
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _sat_historical(layer_id: str, date_str: str, bbox: tuple, W: int, H: int) -> Image.Image:
+    """Past days' GIBS composites never change — keep them on disk across restarts.
+    Failures raise, so a mock fallback is never persisted."""
+    return _gibs_get(layer_id, date_str, bbox, W, H)
+
 @st.cache_data(ttl=300, show_spinner=False)
 def fetch_satellite(layer_id: str, date_str: str, region: str) -> tuple[Optional[Image.Image], bool]:
-    regions = {
-        "Global":(-180,-90,180,90), "North America":(-170,15,-50,80),
-        "Europe":(-30,30,45,75), "Asia Pacific":(60,-15,180,60),
-        "Africa":(-25,-40,60,40), "South America":(-85,-60,-30,15),
-    }
-    bbox = regions.get(region, (-180,-90,180,90))
+    bbox = REGIONS.get(region, REGIONS["Global"])
     lon_s, lat_s = bbox[2]-bbox[0], bbox[3]-bbox[1]
-    W, H = 800, max(200, int(800 * lat_s / lon_s)) if lon_s > 0 else (800,400)
+    W, H = (SAT_WIDTH, max(128, int(SAT_WIDTH * lat_s / lon_s))) if lon_s > 0 else (SAT_WIDTH, SAT_WIDTH//2)
     
     if FORCE_MOCK:
         return _mock_satellite(layer_id, W, H), False
     
-    params = {"SERVICE":"WMS","VERSION":"1.1.1","REQUEST":"GetMap","LAYERS":layer_id,
-              "STYLES":"","SRS":"EPSG:4326",
-              "BBOX":f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}",
-              "WIDTH":str(W),"HEIGHT":str(H),"FORMAT":"image/jpeg","TIME":date_str}
     try:
-        r = requests.get(NASA_GIBS_WMS, params=params, timeout=15,
-                        headers={"User-Agent":"AetherWatch/1.0"})
-        r.raise_for_status()
-        if "image" not in r.headers.get("Content-Type",""):
-            raise ValueError("Non-image response")
-        img = Image.open(io.BytesIO(r.content)).convert("RGB")
-        draw = ImageDraw.Draw(img)
-        draw.rectangle([0,0,W,20], fill=(0,0,0))
-        try: font = ImageFont.load_default()
-        except: font = None
-        draw.text((4,3), f"🛰 NASA GIBS | {layer_id[:40]} | {date_str}", fill=(80,200,80), font=font)
-        return img, True
+        # Today's imagery is still being filled in, so only older dates hit the disk cache
+        today = datetime.datetime.now(datetime.timezone.utc).date().isoformat()
+        get = _sat_historical if date_str < today else _gibs_get
+        return get(layer_id, date_str, bbox, W, H), True
     except Exception as e:
         fire_alert(AL.WARNING, "Satellite API", f"NASA GIBS error: {e}. Using mock imagery.")
         return _mock_satellite(layer_id, W, H), False
@@ -266,19 +385,17 @@ def fetch_satellite(layer_id: str, date_str: str, region: str) -> tuple[Optional
 def _mock_satellite(layer_id: str, W: int, H: int) -> Image.Image:
     ocean = (20,60,140) if "Night" not in layer_id else (5,5,20)
     land = (80,130,60) if "Night" not in layer_id else (255,200,50)
-    pixels = np.full((H,W,3), ocean, dtype=np.uint8)
-    np.random.seed(42)
-    noise = np.random.rand(H//4+1, W//4+1)
+    rng = np.random.default_rng(42)
+    noise = rng.random((H//4+1, W//4+1))
     noise_img = Image.fromarray((noise*255).astype(np.uint8)).resize((W,H), Image.BILINEAR)
     mask = np.array(noise_img) > 110
-    for c in range(3):
-        pixels[:,:,c] = np.where(mask, land[c], ocean[c])
-    pixels = np.clip(pixels.astype(np.int16) + (np.random.rand(H,W)*20-10)[...,np.newaxis], 0, 255).astype(np.uint8)
+    pixels = np.where(mask[...,None], np.array(land,np.int16), np.array(ocean,np.int16))
+    pixels += rng.integers(-10, 11, (H,W,1), dtype=np.int16)
+    pixels = np.clip(pixels, 0, 255).astype(np.uint8)
     img = Image.fromarray(pixels)
     draw = ImageDraw.Draw(img)
     draw.rectangle([0,0,W,20], fill=(0,0,0))
-    try: font = ImageFont.load_default()
-    except: font = None
+    font = _FONT
     draw.text((4,3), f"🛰 SIMULATED | {layer_id[:40]} | Connect to NASA GIBS for real data", fill=(255,80,80), font=font)
     return img
 
@@ -292,27 +409,49 @@ def load_yolo():
         import torch
         device = "cuda" if torch.cuda.is_available() else ("mps" if hasattr(torch.backends,"mps") and torch.backends.mps.is_available() else "cpu")
         model = YOLO(YOLO_MODEL)
-        model(np.zeros((640,640,3),dtype=np.uint8), device=device, verbose=False)  # warm up
+        engine = False
+        if device == "cuda":
+            # One-time TensorRT FP16 export, reused on later starts; stay on .pt if unavailable
+            try:
+                if not os.path.exists(YOLO_ENGINE):
+                    model.export(format="engine", half=True, dynamic=True, batch=4, device=0)
+                model = YOLO(YOLO_ENGINE, task="detect"); engine = True
+            except Exception:
+                pass
+        if device in _HALF_DEVICES and not engine:
+            model.fuse(); model.model.half()
+        with torch.inference_mode():
+            model(np.zeros((640,640,3),dtype=np.uint8), device=device, half=device in _HALF_DEVICES, verbose=False)  # warm up
         return model, device
     except Exception as e:
         return None, "cpu"
 
-def run_yolo(img: Image.Image, model, device: str) -> tuple[Image.Image, list[str], int]:
-    if model is None:
+def run_yolo_batch(imgs: list[Image.Image], model, device: str) -> list:
+    """One batched forward pass over every frame; ``None`` per frame on failure."""
+    if model is None or not imgs:
+        return [None] * len(imgs)
+    try:
+        import torch
+        with torch.inference_mode():
+            return list(model([np.array(img) for img in imgs], device=device, conf=YOLO_CONF,
+                              half=device in _HALF_DEVICES, verbose=False))
+    except Exception:
+        return [None] * len(imgs)
+
+def _draw_yolo(img: Image.Image, r) -> tuple[Image.Image, list[str], int]:
+    if r is None:
         return img, [], 0
     try:
-        arr = np.array(img)
-        results = model(arr, device=device, conf=YOLO_CONF, verbose=False)
-        r = results[0]
         draw = ImageDraw.Draw(img)
-        try: font = ImageFont.load_default()
-        except: font = None
+        font = _FONT
         counts: dict[str,int] = {}
         class_colors = {"person":"#FF4444","car":"#44FF44","truck":"#FF8800","bus":"#FF8800","motorcycle":"#00FFFF","airplane":"#FF44FF","boat":"#4488FF"}
-        for box in r.boxes:
-            cid = int(box.cls[0]); conf = float(box.conf[0])
+        # One device→host transfer per tensor instead of per-box scalar reads
+        xyxy = r.boxes.xyxy.cpu().numpy().astype(np.int32).tolist()
+        cls_arr = r.boxes.cls.cpu().numpy().astype(np.int32).tolist()
+        conf_arr = r.boxes.conf.cpu().numpy().tolist()
+        for (x1,y1,x2,y2), cid, conf in zip(xyxy, cls_arr, conf_arr):
             name = r.names.get(cid, str(cid))
-            x1,y1,x2,y2 = [int(v) for v in box.xyxy[0].tolist()]
             color = class_colors.get(name, "#FFFFFF")
             draw.rectangle([x1,y1,x2,y2], outline=color, width=2)
             label = f"{name} {conf:.0%}"
@@ -332,43 +471,82 @@ def run_yolo(img: Image.Image, model, device: str) -> tuple[Image.Image, list[st
     except Exception as e:
         return img, [], 0
 
+def run_yolo(img: Image.Image, model, device: str) -> tuple[Image.Image, list[str], int]:
+    return _draw_yolo(img, run_yolo_batch([img], model, device)[0])
+
 # ════════════════════════════════════════════════════════════════════════════════
 # SECTION 7 — MAP BUILDER
 # ════════════════════════════════════════════════════════════════════════════════
+_TILES = {
+    "Dark":"CartoDB dark_matter", "Light":"CartoDB positron",
+    "Satellite":"https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+    "Street":"OpenStreetMap",
+}
+_SVG_TEMPLATE = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="16" height="16" style="transform:rotate({H}deg)"><path fill="{C}" d="M21 16v-2l-8-5V3.5A1.5 1.5 0 0 0 11.5 2 1.5 1.5 0 0 0 10 3.5V9l-8 5v2l8-2.5V19l-2 1.5V22l3.5-1 3.5 1v-1.5L13 19v-5.5z"/></svg>'
+
+# FastMarkerCluster callback; row = [lat, lon, heading, color, popup_html, tooltip]
+_AIRCRAFT_MARKER_JS = """function (row) {
+    var icon = L.divIcon({className: 'empty', iconSize: [16,16], iconAnchor: [8,8],
+        html: '%s'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[4], {maxWidth: 200});
+    marker.bindTooltip(row[5]);
+    return marker;
+}""" % _SVG_TEMPLATE.replace("{H}", "' + row[2] + '").replace("{C}", "' + row[3] + '")
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cam_marker_specs(cam_ids: tuple, status: tuple, _cameras: list[dict]) -> dict[str, tuple[str,str,str]]:
+    """``{cam_id: (icon_html, popup_html, tooltip)}``; keyed on ids + online status."""
+    specs = {}
+    for cam, online in zip(_cameras, status):
+        col = "🟢" if online else ("🔴" if online is False else "⚪")
+        specs[cam["id"]] = (
+            f'<div style="font-size:15px">{col}📷</div>',
+            f"<b>{cam['name']}</b><br>{cam['city']}<br>{cam.get('description','')}",
+            cam["name"],
+        )
+    return specs
+
 def build_folium_map(aircraft: list[dict], cameras: list[dict], map_tile: str,
                      show_ac: bool, show_cam: bool, cluster: bool) -> folium.Map:
-    tiles_map = {
-        "Dark":"CartoDB dark_matter", "Light":"CartoDB positron",
-        "Satellite":"https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
-        "Street":"OpenStreetMap",
-    }
-    tile = tiles_map.get(map_tile, "CartoDB dark_matter")
+    tile = _TILES.get(map_tile, "CartoDB dark_matter")
     m = folium.Map(location=[25,10], zoom_start=3, tiles=tile, prefer_canvas=True)
 
     if show_ac and aircraft:
-        grp = folium.plugins.MarkerCluster(name="Aircraft", maxClusterRadius=40, disableClusteringAtZoom=6) if (cluster and len(aircraft)>100) else folium.FeatureGroup(name="Aircraft")
+        rows = []
         for ac in aircraft:
             color = "#d29922" if ac.get("is_mock") else ("#8b949e" if ac.get("on_ground") else "#58a6ff")
-            svg = f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="16" height="16" style="transform:rotate({ac["heading"]}deg)"><path fill="{color}" d="M21 16v-2l-8-5V3.5A1.5 1.5 0 0 0 11.5 2 1.5 1.5 0 0 0 10 3.5V9l-8 5v2l8-2.5V19l-2 1.5V22l3.5-1 3.5 1v-1.5L13 19v-5.5z"/></svg>'
             popup_html = f"<b>✈ {ac['callsign']}</b><br>Alt: {ac['alt_ft']:,} ft<br>Speed: {ac['speed_kts']} kts<br>Country: {ac['country']}<br>Squawk: {ac['squawk'] or 'N/A'}{'<br><b style=color:red>⚠ MOCK</b>' if ac.get('is_mock') else ''}"
-            folium.Marker(
-                [ac["lat"], ac["lon"]],
-                icon=folium.DivIcon(html=svg, icon_size=(16,16), icon_anchor=(8,8)),
-                popup=folium.Popup(popup_html, max_width=200),
-                tooltip=f"{ac['callsign']} | {ac['alt_ft']:,}ft",
-            ).add_to(grp)
-        grp.add_to(m)
+            rows.append([ac["lat"], ac["lon"], ac["heading"], color, popup_html, f"{ac['callsign']} | {ac['alt_ft']:,}ft"])
+        if cluster and len(aircraft) > 100:
+            # Ship compact rows and build markers client-side instead of one JS object per aircraft
+            folium.plugins.FastMarkerCluster(
+                rows, callback=_AIRCRAFT_MARKER_JS, name="Aircraft",
+                options={"maxClusterRadius":40, "disableClusteringAtZoom":6},
+            ).add_to(m)
+        else:
+            grp = folium.FeatureGroup(name="Aircraft")
+            for lat, lon, heading, color, popup_html, tooltip in rows:
+                folium.Marker(
+                    [lat, lon],
+                    icon=folium.DivIcon(html=_SVG_TEMPLATE.format(H=heading, C=color), icon_size=(16,16), icon_anchor=(8,8)),
+                    popup=folium.Popup(popup_html, max_width=200),
+                    tooltip=tooltip,
+                ).add_to(grp)
+            grp.add_to(m)
 
     if show_cam and cameras:
         cam_grp = folium.FeatureGroup(name="Cameras")
+        cam_ids = tuple(c["id"] for c in cameras)
+        status = tuple(_cam_status.get(cid,{}).get("online", None) for cid in cam_ids)
+        specs = _cam_marker_specs(cam_ids, status, cameras)
         for cam in cameras:
-            online = _cam_status.get(cam["id"],{}).get("online", None)
-            col = "🟢" if online else ("🔴" if online is False else "⚪")
+            icon_html, popup_html, tooltip = specs[cam["id"]]
             folium.Marker(
                 [cam["lat"], cam["lon"]],
-                icon=folium.DivIcon(html=f'<div style="font-size:15px">{col}📷</div>', icon_size=(30,20), icon_anchor=(15,10)),
-                popup=f"<b>{cam['name']}</b><br>{cam['city']}<br>{cam.get('description','')}",
-                tooltip=cam["name"],
+                icon=folium.DivIcon(html=icon_html, icon_size=(30,20), icon_anchor=(15,10)),
+                popup=popup_html,
+                tooltip=tooltip,
             ).add_to(cam_grp)
         cam_grp.add_to(m)
 
@@ -384,6 +562,15 @@ def build_folium_map(aircraft: list[dict], cameras: list[dict], map_tile: str,
         </div>""").add_to(m.get_root().html)
     return m
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _aircraft_df(key: tuple, _aircraft: list[dict]) -> pd.DataFrame:
+    """Aircraft table, rebuilt only when ids/positions (``key``) change."""
+    return pd.DataFrame(_aircraft)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _aircraft_csv(key: tuple, _aircraft: list[dict]) -> str:
+    return _aircraft_df(key, _aircraft).to_csv(index=False)
+
 # ════════════════════════════════════════════════════════════════════════════════
 # SECTION 8 — CSS
 # ════════════════════════════════════════════════════════════════════════════════
@@ -395,8 +582,50 @@ def inject_css():
     .block-container{padding-top:0.8rem}
     .stMetric{background:#161b22;padding:10px;border-radius:8px;border:1px solid #30363d}
     ::-webkit-scrollbar{width:5px}::-webkit-scrollbar-thumb{background:#30363d;border-radius:3px}
+    .al{background:#161b22;border-left:3px solid #30363d;border-radius:4px;padding:7px 12px;margin-bottom:5px;font-family:monospace;font-size:12px;color:#e6edf3}
+    .al-ts{color:#8b949e;margin-left:8px}.al-src{color:#58a6ff;margin-left:8px}
+    .al-critical{background:#3d0000;border-color:#f85149}.al-critical .al-lvl{color:#f85149}
+    .al-anomaly{background:#2d1800;border-color:#d29922}.al-anomaly .al-lvl{color:#d29922}
+    .al-warning{background:#1f2200;border-color:#d29922}.al-warning .al-lvl{color:#d29922}
+    .al-info{background:#0d1f0d;border-color:#3fb950}.al-info .al-lvl{color:#3fb950}
+    .al-other .al-lvl{color:#30363d}
     </style>""", unsafe_allow_html=True)
 
+# Alert row markup; colours come from the .al-* classes in inject_css()
+_ALERT_CLASS = {AL.CRITICAL:"critical", AL.ANOMALY:"anomaly", AL.WARNING:"warning", AL.INFO:"info"}
+_ALERT_ROW = ('<div class="al al-{cls}"><span class="al-lvl">{level}</span>'
+              '<span class="al-ts">{timestamp}</span><span class="al-src">[{source}]</span><br>{message}</div>')
+
+@st.fragment
+def render_alerts_tab():
+    """Alert feed; filter changes rerun only this fragment, not the data fetches in main()."""
+    st.subheader("🚨 Alerts & System Log")
+    alerts = get_alerts(100)
+    ac1,ac2,ac3 = st.columns([2,2,1])
+    lvl_filter = ac1.multiselect("Level", [AL.CRITICAL,AL.ANOMALY,AL.WARNING,AL.INFO],
+                                 default=[AL.CRITICAL,AL.ANOMALY,AL.WARNING,AL.INFO])
+    src_filter = ac2.text_input("Source filter")
+    if ac3.button("🗑️ Clear"):
+        _alert_log.clear(); _alert_counts.clear(); st.rerun()
+    
+    lvl_set = frozenset(lvl_filter)
+    filtered = [a for a in alerts if a["level"] in lvl_set and
+               (not src_filter or src_filter.lower() in a["source"].lower())]
+    
+    mc2 = st.columns(4)
+    mc2[0].metric("Total", len(_alert_log))
+    mc2[1].metric("🚨 Critical", _alert_counts[AL.CRITICAL])
+    mc2[2].metric("🔴 Anomalies", _alert_counts[AL.ANOMALY])
+    mc2[3].metric("⚠️ Warnings", _alert_counts[AL.WARNING])
+    
+    st.markdown("---")
+    if not filtered:
+        st.info("✅ No alerts matching filters.")
+    else:
+        cls = _ALERT_CLASS.get
+        html = "".join(_ALERT_ROW.format(cls=cls(a["level"], "other"), **a) for a in filtered)
+        st.markdown(f"<div style='max-height:450px;overflow-y:auto'>{html}</div>", unsafe_allow_html=True)
+
 # ════════════════════════════════════════════════════════════════════════════════
 # SECTION 9 — MAIN APP
 # ════════════════════════════════════════════════════════════════════════════════
@@ -438,7 +667,7 @@ def main():
         
         st.subheader("🛰️ Satellite")
         sat_layer_name = st.selectbox("Layer", list(SATELLITE_LAYERS.keys()))
-        sat_region = st.selectbox("Region", ["Global","North America","Europe","Asia Pacific","Africa","South America"])
+        sat_region = st.selectbox("Region", list(REGIONS))
         sat_date = st.date_input("Date", datetime.date.today() - datetime.timedelta(days=2))
         
         st.markdown("---")
@@ -448,14 +677,17 @@ def main():
     st_autorefresh(interval=refresh_rate*1000, key="main_refresh")
 
     # ── Fetch data
-    aircraft, is_live = fetch_aircraft(osky_user, osky_pass)
+    # Only ask OpenSky for the selected region; the global feed is mostly dropped by MAX_AIRCRAFT
+    aircraft, is_live = fetch_aircraft(osky_user, osky_pass,
+                                       None if sat_region == "Global" else REGIONS[sat_region])
     model, device = load_yolo() if yolo_on else (None, "cpu")
 
     # Emergency squawk alerts
-    for ac in aircraft:
-        if ac["squawk"] in ("7700","7600","7500"):
-            names = {"7700":"Emergency","7600":"Radio Failure","7500":"Hijack"}
-            fire_alert(AL.CRITICAL, "Aviation", f"{ac['callsign']} squawking {ac['squawk']} — {names[ac['squawk']]}")
+    # Width taken from the data: a fixed "<U4" would truncate "77001" into a match
+    sq = np.array([str(a["squawk"] or "") for a in aircraft], dtype=str)
+    for i in np.flatnonzero(np.isin(sq, _EMERG)).tolist():
+        code = str(sq[i])
+        fire_alert(AL.CRITICAL, "Aviation", f"{aircraft[i]['callsign']} squawking {code} — {_EMERG_NAMES[code]}")
 
     # ── Header
     ts = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
@@ -471,7 +703,7 @@ def main():
     mc = st.columns(5)
     mc[0].metric("✈️ Aircraft", len(aircraft))
     mc[1].metric("🛫 Airborne", sum(1 for a in aircraft if not a.get("on_ground")))
-    mc[2].metric("🚨 Alerts", len([a for a in get_alerts(50) if "CRITICAL" in a["level"]]))
+    mc[2].metric("🚨 Alerts", sum(a["level"] == AL.CRITICAL for a in get_alerts(50)))
     mc[3].metric("📷 Cameras", len(sel_ids))
     mc[4].metric("📡 Source", "OpenSky" if is_live else "Simulated")
 
@@ -483,10 +715,9 @@ def main():
         fmap = build_folium_map(aircraft, all_cams, map_tile, show_ac, show_cam_map, cluster)
         st_folium(fmap, width=None, height=530, use_container_width=True, returned_objects=[])
         with st.expander(f"📊 Aircraft Table ({len(aircraft)} total)"):
-            import pandas as pd
-            df = pd.DataFrame(aircraft)
-            st.dataframe(df, use_container_width=True, hide_index=True)
-            st.download_button("⬇️ CSV", df.to_csv(index=False), f"aircraft_{int(time.time())}.csv", "text/csv")
+            ac_key = tuple((a["icao24"], a["lat"], a["lon"]) for a in aircraft)
+            st.dataframe(_aircraft_df(ac_key, aircraft), use_container_width=True, hide_index=True)
+            st.download_button("⬇️ CSV", _aircraft_csv(ac_key, aircraft), f"aircraft_{int(time.time())}.csv", "text/csv")
 
     # ── CAMERAS TAB
     with t_cams:
@@ -511,17 +742,19 @@ def main():
             st.info("👈 Select cameras from the sidebar.")
         else:
             grid = st.columns(min(cam_cols, len(selected)))
-            for idx, cam in enumerate(selected[:4]):
+            selected = selected[:4]
+            # Fetch every feed concurrently (I/O-bound); render in slot order.
+            # fetch_camera_frame only touches module globals, so the worker
+            # threads need no ScriptRunContext.
+            frames = list(_camera_pool().map(_timed_fetch, selected))
+            imgs = [img.resize((640,360), Image.LANCZOS) for img, _, _ in frames]
+            # Single batched YOLO pass over every feed instead of one per cell
+            yolo_results = run_yolo_batch(imgs, model, device) if yolo_on and model else [None] * len(imgs)
+            for idx, (cam, (_, live_feed, fetch_ms), img, res) in enumerate(zip(selected, frames, imgs, yolo_results)):
                 with grid[idx % cam_cols]:
                     st.markdown(f"**📷 {cam['name']}** &nbsp; `{cam['city']}`")
-                    t0 = time.time()
-                    img, live_feed = fetch_camera_frame(cam)
-                    fetch_ms = (time.time()-t0)*1000
-                    img = img.resize((640,360), Image.LANCZOS)
-                    anomalies_det = []
-                    if yolo_on and model:
-                        img, anomalies_det, nd = run_yolo(img, model, device)
-                        for a in anomalies_det: st.warning(a)
+                    img, anomalies_det, nd = _draw_yolo(img, res)
+                    for a in anomalies_det: st.warning(a)
                     badge = "🟢 LIVE" if live_feed else "🟡 SIM"
                     st.image(img, use_container_width=True,
                         caption=f"{badge} | {fetch_ms:.0f}ms" + (f" | YOLO: {nd} objects" if yolo_on else ""))
@@ -546,45 +779,7 @@ def main():
 
     # ── ALERTS TAB
     with t_alerts:
-        st.subheader("🚨 Alerts & System Log")
-        alerts = get_alerts(100)
-        ac1,ac2,ac3 = st.columns([2,2,1])
-        lvl_filter = ac1.multiselect("Level", [AL.CRITICAL,AL.ANOMALY,AL.WARNING,AL.INFO],
-                                     default=[AL.CRITICAL,AL.ANOMALY,AL.WARNING,AL.INFO])
-        src_filter = ac2.text_input("Source filter")
-        if ac3.button("🗑️ Clear"):
-            _alert_log.clear(); st.rerun()
-        
-        filtered = [a for a in alerts if a["level"] in lvl_filter and
-                   (not src_filter or src_filter.lower() in a["source"].lower())]
-        
-        mc2 = st.columns(4)
-        mc2[0].metric("Total", len(_alert_log))
-        mc2[1].metric("🚨 Critical", sum(1 for a in _alert_log if "CRITICAL" in a["level"]))
-        mc2[2].metric("🔴 Anomalies", sum(1 for a in _alert_log if "ANOMALY" in a["level"]))
-        mc2[3].metric("⚠️ Warnings", sum(1 for a in _alert_log if "WARNING" in a["level"]))
-        
-        st.markdown("---")
-        if not filtered:
-            st.info("✅ No alerts matching filters.")
-        else:
-            level_styles = {
-                AL.CRITICAL:("#3d0000","#f85149"),
-                AL.ANOMALY:("#2d1800","#d29922"),
-                AL.WARNING:("#1f2200","#d29922"),
-                AL.INFO:("#0d1f0d","#3fb950"),
-            }
-            html = ""
-            for a in filtered:
-                bg,border = level_styles.get(a["level"],("#161b22","#30363d"))
-                html += f"""<div style="background:{bg};border-left:3px solid {border};
-                    border-radius:4px;padding:7px 12px;margin-bottom:5px;font-family:monospace;
-                    font-size:12px;color:#e6edf3">
-                    <span style="color:{border}">{a['level']}</span>
-                    <span style="color:#8b949e;margin-left:8px">{a['timestamp']}</span>
-                    <span style="color:#58a6ff;margin-left:8px">[{a['source']}]</span><br>
-                    {a['message']}</div>"""
-            st.markdown(f"<div style='max-height:450px;overflow-y:auto'>{html}</div>", unsafe_allow_html=True)
+        render_alerts_tab()
 
     # ── Footer
     st.markdown("<hr style='border-color:#30363d;margin-top:16px'><div style='text-align:center;font-size:11px;color:#8b949e'>AetherWatch v1.0.0 | Data: <a href='https://opensky-network.org' style='color:#58a6ff'>OpenSky</a> • <a href='https://earthdata.nasa.gov' style='color:#58a6ff'>NASA GIBS</a> | Educational use only | Not for surveillance of individuals</div>", unsafe_allow_html=True)
@@ -5,6 +5,9 @@ Edit this file to customise AetherWatch for your use case.
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,15 +30,20 @@ load_dotenv()
 # ═══════════════════════════════════════════════════════════════════════════════
 
 # ── Credentials ──────────────────────────────────────────────────────────────
-def _get_secret(key: str, fallback: str = "") -> str:
-    """Read from Streamlit secrets first, then env vars, then fallback."""
+@lru_cache(maxsize=1)
+def _secrets_dict() -> dict:
+    """Snapshot Streamlit secrets once; empty when there is no secrets.toml."""
     try:
         import streamlit as st
-        # st.secrets[key] raises KeyError if missing — handle it properly
-        if key in st.secrets:
-            return str(st.secrets[key])
+        return dict(st.secrets)
     except Exception:
-        pass
+        return {}
+
+def _get_secret(key: str, fallback: str = "") -> str:
+    """Read from Streamlit secrets first, then env vars, then fallback."""
+    secrets = _secrets_dict()
+    if key in secrets:
+        return str(secrets[key])
     return os.getenv(key, fallback)
 
 def _get_bool_secret(key: str, fallback: bool = False) -> bool:
@@ -61,6 +69,9 @@ TWILIO_AUTH_TOKEN: str = _get_secret("TWILIO_AUTH_TOKEN")
 TWILIO_FROM_NUMBER: str = _get_secret("TWILIO_FROM_NUMBER")
 TWILIO_TO_NUMBER: str = _get_secret("TWILIO_TO_NUMBER")
 
+# Optional Redis, shared by all worker processes (e.g. redis://localhost:6379/0)
+REDIS_URL: str = _get_secret("REDIS_URL")
+
 # Developer overrides
 FORCE_MOCK_DATA: bool = _get_bool_secret("FORCE_MOCK_DATA", False)
 LOG_LEVEL: str = _get_secret("LOG_LEVEL", "INFO")
@@ -87,17 +98,17 @@ NASA_GIBS_WMS_URL = "https://gibs.earthdata.nasa.gov/wms/epsg4326/best/wms.cgi"
 NASA_GIBS_WMS = NASA_GIBS_WMS_URL
 NASA_CACHE_TTL = 300  # 5 minutes
 
-NASA_LAYERS: dict[str, str] = {
+NASA_LAYERS: MappingProxyType = MappingProxyType({
     "MODIS Terra — True Color": "MODIS_Terra_CorrectedReflectance_TrueColor",
     "MODIS Aqua — True Color": "MODIS_Aqua_CorrectedReflectance_TrueColor",
     "VIIRS SNPP — True Color": "VIIRS_SNPP_CorrectedReflectance_TrueColor",
     "VIIRS SNPP — Day/Night Band": "VIIRS_SNPP_DayNightBand_ENCC",
     "MODIS Terra — Land Surface Temp": "MODIS_Terra_Land_Surface_Temp_Day",
     "MODIS Terra — Fires & Thermal": "MODIS_Terra_Thermal_Anomalies_All",
-}
+})
 
 # ── Traffic Cameras ──────────────────────────────────────────────────────────
-PUBLIC_CAMERAS: list[dict] = [
+_RAW_CAMERAS: list[dict] = [
     {
         "id": "cam_nyc_01",
         "name": "NYC — Manhattan Bridge",
@@ -190,11 +201,21 @@ PUBLIC_CAMERAS: list[dict] = [
     },
 ]
 
+# Read-only views: config is shared by every session, so nothing may mutate it.
+PUBLIC_CAMERAS: tuple[MappingProxyType, ...] = tuple(
+    MappingProxyType({**c, "location": tuple(c["location"])}) for c in _RAW_CAMERAS
+)
+del _RAW_CAMERAS
+
 # ── YOLO ─────────────────────────────────────────────────────────────────────
 YOLO_MODEL = "yolov8n.pt"
-YOLO_MODEL_NAME = "yolov8n.pt"
+YOLO_MODEL_NAME = YOLO_MODEL
 YOLO_CONFIDENCE = 0.35
+YOLO_IOU_THRESHOLD = 0.45
 YOLO_INPUT_SIZE = 640
+YOLO_IMG_SIZE = YOLO_INPUT_SIZE
+YOLO_FRAME_BUDGET_S = 1.0  # max wait per refresh before reusing the last detections
+YOLO_CPU_ONNX = _get_bool_secret("YOLO_CPU_ONNX", True)  # export + run via ONNX Runtime on CPU
 YOLO_TARGET_CLASSES = [
     0,   # person
     1,   # bicycle
@@ -210,6 +231,8 @@ YOLO_TARGET_CLASSES = [
 # ── Anomaly Detection Thresholds ─────────────────────────────────────────────
 ANOMALY_VEHICLE_CLUSTER_MIN = 6
 ANOMALY_PERSON_CLUSTER_MIN = 10
+ANOMALY_CROWD_THRESHOLD = 8            # persons per frame
+ANOMALY_VEHICLE_CLUSTER = ANOMALY_VEHICLE_CLUSTER_MIN
 ANOMALY_LOW_ALTITUDE_FT = 3000
 ANOMALY_HIGH_SPEED_KTS = 600
 
@@ -227,12 +250,12 @@ MAX_REFRESH_RATE = 120
 CACHE_TTL_AVIATION = 30
 CACHE_TTL_SATELLITE = 300
 
-MAP_TILES = {
+MAP_TILES = MappingProxyType({
     "CartoDB dark_matter": "CartoDB dark_matter",
     "CartoDB positron": "CartoDB positron",
     "OpenStreetMap": "OpenStreetMap",
-}
-SATELLITE_LAYERS = {
+})
+SATELLITE_LAYERS = MappingProxyType({
     "True Color (MODIS Terra)": "MODIS_Terra_CorrectedReflectance_TrueColor",
     "Night Lights (VIIRS)": "VIIRS_Black_Marble",
     "Sea Surface Temperature": "MUR-JPL-L4-GLOB-v4.1",
@@ -241,4 +264,4 @@ SATELLITE_LAYERS = {
     "Vegetation (NDVI)": "MODIS_Terra_NDVI_8Day",
     "Land Surface Temp": "MODIS_Terra_Land_Surface_Temp_Day",
     "Aqua True Color": "MODIS_Aqua_CorrectedReflectance_TrueColor",
-}
+})
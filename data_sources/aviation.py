@@ -1,60 +1,127 @@
 """
 AetherWatch — Aviation Data Source
-Primary:  airplanes.live  (free, no auth, wide radius grid)
-Fallback: OpenSky Network via OAuth2 client credentials
+Primary:  airplanes.live (free, no auth, wide radius grid) raced against adsb.fi
+Fallback: OpenSky Network (OAuth2 client credentials)
 Last:     Mock data
 """
 
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from functools import partial
+from operator import attrgetter, itemgetter
+from sys import intern
+
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    # several times faster than json on the aircraft payloads; dumps returns bytes
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+    from json import loads as _loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+try:
+    import simdjson  # optional (pysimdjson): lazy DOM for the OpenSky states array
+except ImportError:
+    simdjson = None
 
 from config.settings import (
     OPENSKY_USERNAME,
     OPENSKY_PASSWORD,
     FR24_API_TOKEN,
     FORCE_MOCK_DATA,
-    OPENSKY_CACHE_TTL,
 )
-from utils.cache import aviation_cache
+from utils.cache import shared_cache
+from utils.jit import njit, NUMBA_AVAILABLE
 from utils.logger import logger
 from utils.mock_data import generate_mock_aircraft
 
 OPENSKY_TOKEN_URL  = "https://auth.opensky-network.org/auth/realms/opensky-network/protocol/openid-connect/token"
 OPENSKY_STATES_URL = "https://opensky-network.org/api/states/all"
+ADSB_FI_URL        = "https://opendata.adsb.fi/api/v2/aircraft"
+
+# One pooled keep-alive session for every aviation host (token, states, grid).
+# Compression is asked for explicitly: the states payload is megabytes of JSON
+# numbers. Transient gateway errors are retried with a short backoff (idempotent
+# requests only — the token POST is never replayed).
+_session = requests.Session()
+_session.headers.update({
+    "User-Agent":      "AetherWatch/1.0",
+    "Accept":          "application/json",
+    "Accept-Encoding": "gzip, deflate",
+})
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
 
 # Read OAuth2 credentials from Streamlit secrets (same place as username/password)
 import streamlit as st
 
+# Client-credentials tokens are valid for ~30 min: reuse one until shortly before
+# it expires. The lock also stops concurrent fetches from each requesting a token.
+_oauth_lock = threading.Lock()
+_oauth_token: str | None = None
+_oauth_expiry = 0.0
+OAUTH_EXPIRY_MARGIN_S = 60
+
+
 def _get_opensky_oauth_token() -> str | None:
-    """Get an OAuth2 bearer token using client credentials flow."""
-    try:
-        client_id     = st.secrets.get("OPENSKY_CLIENT_ID", "")
-        client_secret = st.secrets.get("OPENSKY_CLIENT_SECRET", "")
-        if not client_id or not client_secret:
-            logger.warning("OpenSky OAuth2: OPENSKY_CLIENT_ID or OPENSKY_CLIENT_SECRET not set in secrets")
+    """Get an OAuth2 bearer token using client credentials flow (cached until near expiry)."""
+    global _oauth_token, _oauth_expiry
+    with _oauth_lock:
+        if _oauth_token and time.time() < _oauth_expiry:
+            return _oauth_token
+        try:
+            client_id     = st.secrets.get("OPENSKY_CLIENT_ID", "")
+            client_secret = st.secrets.get("OPENSKY_CLIENT_SECRET", "")
+            if not client_id or not client_secret:
+                logger.warning("OpenSky OAuth2: OPENSKY_CLIENT_ID or OPENSKY_CLIENT_SECRET not set in secrets")
+                return None
+
+            resp = _session.post(
+                OPENSKY_TOKEN_URL,
+                data={
+                    "grant_type":    "client_credentials",
+                    "client_id":     client_id,
+                    "client_secret": client_secret,
+                },
+                timeout=15,
+            )
+            if resp.status_code != 200:
+                logger.warning("OpenSky token request failed: {}", resp.status_code)
+                return None
+
+            payload = _loads(resp.content)
+            token = payload.get("access_token")
+            if token:
+                _oauth_token = token
+                _oauth_expiry = time.time() + float(payload.get("expires_in", 1800)) - OAUTH_EXPIRY_MARGIN_S
+                logger.info("OpenSky OAuth2 token obtained")
+            return token
+        except Exception as e:
+            logger.warning("OpenSky OAuth2 token error: {}", e)
             return None
 
-        resp = requests.post(
-            OPENSKY_TOKEN_URL,
-            data={
-                "grant_type":    "client_credentials",
-                "client_id":     client_id,
-                "client_secret": client_secret,
-            },
-            timeout=15,
-        )
-        if resp.status_code != 200:
-            logger.warning("OpenSky token request failed: {}", resp.status_code)
-            return None
 
-        token = resp.json().get("access_token")
-        if token:
-            logger.info("OpenSky OAuth2 token obtained")
-        return token
-    except Exception as e:
-        logger.warning("OpenSky OAuth2 token error: {}", e)
-        return None
+def _invalidate_oauth_token():
+    """Drop the cached token (e.g. after a 401) so the next fetch requests a new one."""
+    global _oauth_token
+    with _oauth_lock:
+        _oauth_token = None
 
 
 # Wide-coverage grid for airplanes.live (6000nm radius per point)
@@ -65,81 +132,242 @@ _GLOBAL_GRID = [
     (-30,  120),
 ]
 
-_session = requests.Session()
-_session.headers.update({"User-Agent": "AetherWatch/1.0"})
+# Most aircraft kept from any one source (the map and table show no more)
+MAX_AIRCRAFT = 500
+
+# Raw grid responses in the shared (Redis) cache; about the feed's refresh interval
+GRID_SHARED_TTL_S = 45
+
+
+# Transponder codes are four octal digits; anything else is feed noise
+_SQUAWK_RE = re.compile(r"[0-7]{4}")
+
+
+def _squawk(value) -> str:
+    """Interned squawk code, or "----" when absent or malformed."""
+    if isinstance(value, str) and _SQUAWK_RE.fullmatch(value):
+        return intern(value)
+    return "----"
 
 
 def _parse_v2_aircraft(ac: dict) -> dict | None:
+    lat = ac.get("lat")
+    lon = ac.get("lon")
+    if lat is None or lon is None:
+        return None
+
+    alt_baro = ac.get("alt_baro", 0)
+    if alt_baro == "ground":  # the map only shows airborne traffic
+        return None
     try:
-        lat = ac.get("lat")
-        lon = ac.get("lon")
-        if lat is None or lon is None:
-            return None
-        alt_baro = ac.get("alt_baro", 0)
-        if alt_baro == "ground":
-            alt_baro = 0
-            on_ground = True
-        else:
-            on_ground = False
-            try:
-                alt_baro = float(alt_baro or 0)
-            except Exception:
-                alt_baro = 0
+        alt_ft = float(alt_baro or 0)
+    except (TypeError, ValueError):
+        alt_ft = 0.0
 
-        return {
-            "icao24":         ac.get("hex", ""),
-            "callsign":       (ac.get("flight") or "UNKNOWN").strip(),
-            "origin_country": ac.get("r", ""),
-            "latitude":       float(lat),
-            "longitude":      float(lon),
-            "altitude_ft":    float(alt_baro),
-            "altitude_m":     float(alt_baro) * 0.3048,
-            "velocity_kts":   float(ac.get("gs", 0) or 0),
-            "heading":        float(ac.get("track", 0) or 0),
-            "vertical_rate":  float(ac.get("baro_rate", 0) or 0),
-            "on_ground":      on_ground,
-            "squawk":         ac.get("squawk", "----"),
-            "aircraft_type":  ac.get("t", ""),
-            "last_contact":   int(time.time()),
-            "is_mock":        False,
-        }
+    # Only numeric fields can be malformed; a bad one drops the record
+    try:
+        lat, lon = float(lat), float(lon)
+        velocity = float(ac.get("gs") or 0)
+        heading = float(ac.get("track") or 0)
+        vertical_rate = float(ac.get("baro_rate") or 0)
+    except (TypeError, ValueError):
+        return None
+
+    return {
+        "icao24":         ac.get("hex", ""),
+        "callsign":       (ac.get("flight") or "UNKNOWN").strip(),
+        "origin_country": intern(ac.get("r") or ""),
+        "latitude":       lat,
+        "longitude":      lon,
+        "altitude_ft":    alt_ft,
+        "altitude_m":     alt_ft * 0.3048,
+        "velocity_kts":   velocity,
+        "heading":        heading,
+        "vertical_rate":  vertical_rate,
+        "on_ground":      False,
+        "squawk":         _squawk(ac.get("squawk")),
+        "aircraft_type":  intern(ac.get("t") or ""),
+        "last_contact":   int(time.time()),
+        "is_mock":        False,
+    }
+
+
+@njit(cache=True)
+def _airborne_kernel(lat, lon, on_ground, lamin, lomin, lamax, lomax, limit):
+    out = np.empty(min(lat.shape[0], limit), dtype=np.int64)
+    n = 0
+    for i in range(lat.shape[0]):
+        if n == limit:
+            break
+        # NaN fails every comparison, so rows without a position drop out here too
+        if not on_ground[i] and lamin <= lat[i] <= lamax and lomin <= lon[i] <= lomax:
+            out[n] = i
+            n += 1
+    return out[:n]
+
+
+def _airborne_indices(lat: np.ndarray, lon: np.ndarray, on_ground: np.ndarray,
+                      bbox: tuple | None = None, limit: int | None = None) -> np.ndarray:
+    """
+    Indices of the first ``limit`` rows that have a position, are airborne and
+    fall inside ``(lamin, lomin, lamax, lomax)``. With numba the predicates are
+    fused into one pass that stops at ``limit``; otherwise one NumPy mask.
+    """
+    lamin, lomin, lamax, lomax = bbox if bbox is not None else (-np.inf, -np.inf, np.inf, np.inf)
+    if limit is None:
+        limit = lat.shape[0]
+    if NUMBA_AVAILABLE:
+        return _airborne_kernel(lat, lon, on_ground, lamin, lomin, lamax, lomax, limit)
+    mask = ~on_ground & (lat >= lamin) & (lat <= lamax) & (lon >= lomin) & (lon <= lomax)
+    return np.flatnonzero(mask)[:limit]
+
+
+def _parse_v2_records(records: list[dict], bbox: tuple | None = None, limit: int | None = None) -> list[dict]:
+    """
+    Batch form of ``_parse_v2_aircraft`` for airborne aircraft. Positions, the
+    "ground" altitude flag and the optional ``(lamin, lomin, lamax, lomax)``
+    clip are masked as arrays and ft → m is one vector multiply. Falls back to
+    the per-record parser if the payload does not fit the columnar path.
+    """
+    if not records:
+        return []
+    try:
+        lat = np.array([ac.get("lat") for ac in records], dtype=np.float64)
+        lon = np.array([ac.get("lon") for ac in records], dtype=np.float64)
+        on_ground = np.array([ac.get("alt_baro") == "ground" for ac in records], dtype=bool)
+        keep = _airborne_indices(lat, lon, on_ground, bbox, limit).tolist()
+        if not keep:
+            return []
+
+        kept = [records[i] for i in keep]
+        alt_ft = _num_column([ac.get("alt_baro") for ac in kept])
+        now = int(time.time())
+        return [
+            {
+                "icao24":         ac.get("hex", ""),
+                "callsign":       (ac.get("flight") or "UNKNOWN").strip(),
+                "origin_country": intern(ac.get("r") or ""),
+                "latitude":       la,
+                "longitude":      lo,
+                "altitude_ft":    aft,
+                "altitude_m":     am,
+                "velocity_kts":   vel,
+                "heading":        hdg,
+                "vertical_rate":  vr,
+                "on_ground":      False,
+                "squawk":         _squawk(ac.get("squawk")),
+                "aircraft_type":  intern(ac.get("t") or ""),
+                "last_contact":   now,
+                "is_mock":        False,
+            }
+            for ac, la, lo, aft, am, vel, hdg, vr in zip(
+                kept, lat[keep].tolist(), lon[keep].tolist(),
+                alt_ft.tolist(), (alt_ft * 0.3048).tolist(),
+                _num_column([ac.get("gs") for ac in kept]).tolist(),
+                _num_column([ac.get("track") for ac in kept]).tolist(),
+                _num_column([ac.get("baro_rate") for ac in kept]).tolist(),
+            )
+        ]
     except Exception:
+        aircraft = []
+        for ac in records:
+            parsed = _parse_v2_aircraft(ac)
+            if parsed is None:
+                continue
+            if bbox is not None and not (bbox[0] <= parsed["latitude"] <= bbox[2]
+                                         and bbox[1] <= parsed["longitude"] <= bbox[3]):
+                continue
+            aircraft.append(parsed)
+            if len(aircraft) == limit:
+                break
+        return aircraft
+
+
+# Validators and decoded body per URL: (etag, last_modified, payload). A 304
+# reply to a repeat poll then skips both the download and the JSON decode.
+_conditional_cache: dict[str, tuple[str | None, str | None, dict]] = {}
+
+
+def _get_json(url: str, timeout: float) -> dict:
+    """GET and decode a JSON object, revalidating a previous response when possible."""
+    headers = {}
+    cached = _conditional_cache.get(url)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    resp = _session.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304 and cached is not None:
+        return cached[2]
+    resp.raise_for_status()
+    payload = _loads(resp.content)
+
+    etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _conditional_cache[url] = (etag, last_modified, payload)
+    return payload
+
+
+def _grid_key(point: tuple[int, int]) -> str:
+    return f"airplanes.live:{point[0]}:{point[1]}"
+
+
+def _fetch_grid_point(point: tuple[int, int], shared: list[dict] | None = None) -> list[dict] | None:
+    """
+    Raw ``ac`` records for one airplanes.live grid point, or None on failure.
+    ``shared`` is the point's entry from the cross-process cache, if any.
+    """
+    if shared is not None:
+        return shared
+    lat, lon = point
+    url = f"https://api.airplanes.live/v2/point/{lat}/{lon}/6000"
+    try:
+        records = _get_json(url, timeout=20).get("ac", [])
+        shared_cache.set(_grid_key(point), records, GRID_SHARED_TTL_S)
+        return records
+    except Exception as e:
+        logger.warning("airplanes.live {}/{} error: {}", lat, lon, e)
         return None
 
 
+# Long-lived: a fresh pool per poll would spawn and join four threads every time
+_grid_pool = ThreadPoolExecutor(max_workers=len(_GLOBAL_GRID), thread_name_prefix="airplanes-live")
+
+
 def _fetch_airplanes_live() -> list[dict] | None:
     seen = set()
     aircraft = []
     success = 0
 
-    for lat, lon in _GLOBAL_GRID:
-        url = f"https://api.airplanes.live/v2/point/{lat}/{lon}/6000"
-        try:
-            resp = _session.get(url, timeout=20)
-            if resp.status_code != 200:
-                logger.warning("airplanes.live {}/{} status {}", lat, lon, resp.status_code)
-                continue
-            count = 0
-            for ac in resp.json().get("ac", []):
-                hex_id = ac.get("hex", "")
-                if hex_id in seen:
-                    continue
+    # All grid points in flight at once (wall time ≈ slowest point). Workers
+    # download and decode; this thread de-duplicates and parses each point as
+    # soon as it (and every point before it) is in, overlapping the parse with
+    # the remaining requests. Grid order keeps the result deterministic.
+    # Points another worker process fetched recently come from the shared cache.
+    shared = shared_cache.get_many([_grid_key(p) for p in _GLOBAL_GRID])
+    for (lat, lon), records in zip(_GLOBAL_GRID, _grid_pool.map(_fetch_grid_point, _GLOBAL_GRID, shared)):
+        if records is None:
+            continue
+        unique = []
+        for ac in records:
+            hex_id = ac.get("hex", "")
+            if hex_id not in seen:
                 seen.add(hex_id)
-                parsed = _parse_v2_aircraft(ac)
-                if parsed and not parsed["on_ground"]:
-                    aircraft.append(parsed)
-                    count += 1
-            logger.info("airplanes.live {}/{}: {} aircraft", lat, lon, count)
-            success += 1
-        except Exception as e:
-            logger.warning("airplanes.live {}/{} error: {}", lat, lon, e)
+                unique.append(ac)
+        parsed = _parse_v2_records(unique)
+        aircraft.extend(parsed)
+        logger.info("airplanes.live {}/{}: {} aircraft", lat, lon, len(parsed))
+        success += 1
 
     if success == 0:
         logger.warning("airplanes.live: all grid points failed")
         return None
 
     if aircraft:
-        result = aircraft[:500]
+        result = aircraft[:MAX_AIRCRAFT]
         logger.info("airplanes.live total: {} unique airborne aircraft", len(result))
         return result
 
@@ -148,32 +376,156 @@ def _fetch_airplanes_live() -> list[dict] | None:
 
 
 def _parse_opensky_state(state: list) -> dict | None:
+    if not state or len(state) < 15:
+        return None
+    lat = state[6]
+    lon = state[5]
+    if lat is None or lon is None:
+        return None
+    if state[8]:  # on_ground — the map only shows airborne traffic
+        return None
+
+    # Only numeric fields can be malformed; a bad one drops the state
     try:
-        lat = state[6]
-        lon = state[5]
-        if lat is None or lon is None:
-            return None
-        alt_m = state[7] or 0
-        return {
-            "icao24":         state[0] or "",
-            "callsign":       (state[1] or "UNKNOWN").strip(),
-            "origin_country": state[2] or "",
-            "latitude":       float(lat),
-            "longitude":      float(lon),
-            "altitude_m":     float(alt_m),
-            "altitude_ft":    float(alt_m) * 3.28084,
-            "velocity_kts":   float(state[9] or 0) * 1.94384,
-            "heading":        float(state[10] or 0),
-            "vertical_rate":  float(state[11] or 0) * 196.85,
-            "on_ground":      bool(state[8]),
-            "squawk":         state[14] or "----",
-            "aircraft_type":  "",
-            "last_contact":   int(time.time()),
-            "is_mock":        False,
-        }
-    except Exception:
+        lat, lon = float(lat), float(lon)
+        alt_m = float(state[7] or 0)
+        velocity = float(state[9] or 0)
+        heading = float(state[10] or 0)
+        vertical_rate = float(state[11] or 0)
+    except (TypeError, ValueError):
         return None
 
+    return {
+        "icao24":         state[0] or "",
+        "callsign":       (state[1] or "UNKNOWN").strip(),
+        "origin_country": intern(state[2] or ""),
+        "latitude":       lat,
+        "longitude":      lon,
+        "altitude_m":     alt_m,
+        "altitude_ft":    alt_m * 3.28084,
+        "velocity_kts":   velocity * 1.94384,
+        "heading":        heading,
+        "vertical_rate":  vertical_rate * 196.85,
+        "on_ground":      False,
+        "squawk":         _squawk(state[14]),
+        "aircraft_type":  "",
+        "last_contact":   int(time.time()),
+        "is_mock":        False,
+    }
+
+
+def _num_column(col: tuple) -> np.ndarray:
+    """Numeric column (state vector or v2 field) as float64, with ``None`` → 0."""
+    return np.nan_to_num(np.array(col, dtype=np.float64), nan=0.0)
+
+
+@njit(cache=True, fastmath=True)
+def _convert_units_kernel(alt_m, vel_ms, vrate_ms):
+    n = alt_m.shape[0]
+    alt_ft = np.empty(n)
+    vel_kts = np.empty(n)
+    vrate_fpm = np.empty(n)
+    for i in range(n):
+        alt_ft[i] = alt_m[i] * 3.28084
+        vel_kts[i] = vel_ms[i] * 1.94384
+        vrate_fpm[i] = vrate_ms[i] * 196.85
+    return alt_ft, vel_kts, vrate_fpm
+
+
+def _convert_units(alt_m: np.ndarray, vel_ms: np.ndarray, vrate_ms: np.ndarray):
+    """m → ft, m/s → kts, m/s → ft/min in one pass (JIT-compiled when numba is installed)."""
+    if NUMBA_AVAILABLE:
+        return _convert_units_kernel(alt_m, vel_ms, vrate_ms)
+    return alt_m * 3.28084, vel_ms * 1.94384, vrate_ms * 196.85
+
+
+def _parse_opensky_states(states: list[list], limit: int = MAX_AIRCRAFT) -> list[dict]:
+    """
+    Batch form of ``_parse_opensky_state``. Position and ground flags are
+    masked as whole arrays; only the first ``limit`` survivors
+    are transposed into columns, unit-converted and turned into dicts. Falls
+    back to the per-row parser if the payload does not fit the columnar path.
+    """
+    if not states:
+        return []
+    try:
+        # float64 conversion maps None → NaN, so missing positions mask out directly
+        lat = np.array(list(map(itemgetter(6), states)), dtype=np.float64)
+        lon = np.array(list(map(itemgetter(5), states)), dtype=np.float64)
+        on_ground = np.array(list(map(itemgetter(8), states)), dtype=bool)
+        keep = _airborne_indices(lat, lon, on_ground, limit=limit)
+        if len(keep) == 0:
+            return []
+
+        cols = list(zip(*(states[i] for i in keep.tolist())))
+        alt_m = _num_column(cols[7])
+        alt_ft, vel_kts, vrate_fpm = _convert_units(alt_m, _num_column(cols[9]), _num_column(cols[11]))
+        now = int(time.time())
+        # Only a few hundred distinct countries/squawks: share one str object per value
+        countries = [intern(c or "") for c in cols[2]]
+        squawks = [_squawk(sq) for sq in cols[14]]
+        return [
+            {
+                "icao24":         icao or "",
+                "callsign":       (cs or "UNKNOWN").strip(),
+                "origin_country": country,
+                "latitude":       la,
+                "longitude":      lo,
+                "altitude_m":     am,
+                "altitude_ft":    aft,
+                "velocity_kts":   vel,
+                "heading":        hdg,
+                "vertical_rate":  vr,
+                "on_ground":      False,
+                "squawk":         sq,
+                "aircraft_type":  "",
+                "last_contact":   now,
+                "is_mock":        False,
+            }
+            for icao, cs, country, la, lo, am, aft, vel, hdg, vr, sq in zip(
+                cols[0], cols[1], countries,
+                lat[keep].tolist(), lon[keep].tolist(),
+                alt_m.tolist(), alt_ft.tolist(), vel_kts.tolist(),
+                _num_column(cols[10]).tolist(),
+                vrate_fpm.tolist(),
+                squawks,
+            )
+        ]
+    except Exception:
+        parsed = (_parse_opensky_state(s) for s in states)
+        return [p for p in parsed if p is not None][:limit]
+
+
+# simdjson parsers are not thread-safe and OpenSky is fetched from the fallback pool
+_parser_local = threading.local()
+
+
+def _load_states(content: bytes):
+    """
+    The ``states`` rows of an OpenSky response. With pysimdjson installed the
+    rows stay lazy, so the fields the parser never reads are never decoded;
+    otherwise the payload is fully decoded with ``_loads``.
+    """
+    if simdjson is None:
+        return _loads(content).get("states") or []
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+    # Row proxies in a plain list: O(1) row indexing, fields still decoded on access
+    return list(parser.parse(content).get("states") or ())
+
+
+def _request_opensky(params: dict, headers: dict | None, label: str) -> list[dict] | None:
+    """One states/all request and parse; raises on HTTP or transport errors."""
+    resp = _session.get(OPENSKY_STATES_URL, params=params, headers=headers, timeout=20)
+    resp.raise_for_status()
+    aircraft = _parse_opensky_states(_load_states(resp.content))
+    if aircraft:
+        logger.info("OpenSky ({}): {} airborne aircraft", label, len(aircraft))
+        return aircraft
+    logger.warning("OpenSky ({}): connected but no aircraft returned", label)
+    return None
+
 
 def _fetch_opensky(lamin=-90, lomin=-180, lamax=90, lomax=180) -> list[dict] | None:
     params = {"lamin": lamin, "lomin": lomin, "lamax": lamax, "lomax": lomax}
@@ -182,55 +534,88 @@ def _fetch_opensky(lamin=-90, lomin=-180, lamax=90, lomax=180) -> list[dict] | N
     token = _get_opensky_oauth_token()
     if token:
         try:
-            headers = {"Authorization": f"Bearer {token}"}
-            resp = _session.get(OPENSKY_STATES_URL, params=params, headers=headers, timeout=20)
-            resp.raise_for_status()
-            states = resp.json().get("states") or []
-            aircraft = [p for s in states if (p := _parse_opensky_state(s)) is not None]
-            aircraft = [a for a in aircraft if not a["on_ground"]]
-            if aircraft:
-                logger.info("OpenSky (OAuth2): {} airborne aircraft", len(aircraft))
-                return aircraft
-            logger.warning("OpenSky (OAuth2): connected but no aircraft returned")
-            return None
+            return _request_opensky(params, {"Authorization": f"Bearer {token}"}, "OAuth2")
         except Exception as e:
             logger.warning("OpenSky (OAuth2) request failed: {}", e)
+            if isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code == 401:
+                _invalidate_oauth_token()
 
     # Try anonymous as last resort
     try:
-        resp = _session.get(OPENSKY_STATES_URL, params=params, timeout=20)
-        resp.raise_for_status()
-        states = resp.json().get("states") or []
-        aircraft = [p for s in states if (p := _parse_opensky_state(s)) is not None]
-        aircraft = [a for a in aircraft if not a["on_ground"]]
-        if aircraft:
-            logger.info("OpenSky (anonymous): {} airborne aircraft", len(aircraft))
-            return aircraft
-        return None
+        return _request_opensky(params, None, "anonymous")
     except Exception as e:
         logger.warning("OpenSky (anonymous) failed: {}", e)
         return None
 
 
-def fetch_opensky(lamin=-90, lomin=-180, lamax=90, lomax=180) -> list[dict]:
-    cache_key = f"opensky:{lamin},{lomin},{lamax},{lomax}"
-    cached = aviation_cache.get(cache_key)
-    if cached is not None:
-        return cached
+def _fetch_adsb_fi(lamin=-90, lomin=-180, lamax=90, lomax=180) -> list[dict] | None:
+    try:
+        payload = _get_json(ADSB_FI_URL, timeout=20)
+    except Exception as e:
+        logger.warning("adsb.fi failed: {}", e)
+        return None
 
+    # Global snapshot in the same readsb v2 shape as airplanes.live; clip to the bbox here
+    aircraft = _parse_v2_records(
+        payload.get("aircraft") or payload.get("ac") or [],
+        bbox=(lamin, lomin, lamax, lomax),
+        limit=MAX_AIRCRAFT,
+    )
+
+    if aircraft:
+        logger.info("adsb.fi: {} airborne aircraft", len(aircraft))
+        return aircraft
+    logger.warning("adsb.fi: connected but no airborne aircraft")
+    return None
+
+
+# Long-lived so the caller can return while a slower source is still running
+_fallback_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aviation-fallback")
+
+# Longest the race waits overall: each source's own request timeout (20 s) plus parsing
+RACE_DEADLINE_S = 25
+
+
+def _race(*fetchers, deadline: float = RACE_DEADLINE_S) -> list[dict] | None:
+    """
+    Run the zero-argument ``fetchers`` concurrently; first non-empty result wins.
+    Returns None if none succeeds within ``deadline`` seconds.
+
+    A fetcher that has already started cannot be cancelled: the losing source
+    still finishes its download and parse on the pool (occupying a worker
+    until then) and its result is discarded. Only fetchers still queued are
+    cancelled.
+    """
+    futures = [_fallback_pool.submit(fetch) for fetch in fetchers]
+    try:
+        for fut in as_completed(futures, timeout=deadline):
+            aircraft = fut.result()
+            if aircraft:
+                return aircraft
+    except FuturesTimeout:
+        logger.warning("Aviation sources gave no result within {}s", deadline)
+    finally:
+        for fut in futures:
+            fut.cancel()
+    return None
+
+
+def fetch_opensky(lamin=-90, lomin=-180, lamax=90, lomax=180) -> list[dict]:
+    """
+    Uncached: the aviation worker is the only caller and refreshes less often
+    than any cache TTL would hold, so its snapshot is the cache.
+    """
     if FORCE_MOCK_DATA:
         logger.info("FORCE_MOCK_DATA is set — returning mock aircraft")
-        mock = generate_mock_aircraft(500)
-        aviation_cache.set(cache_key, mock)
-        return mock
+        return generate_mock_aircraft(500)
 
-    # 1. airplanes.live
-    logger.info("Trying airplanes.live…")
-    aircraft = _fetch_airplanes_live()
+    # 1. The keyless feeds in parallel: a slow source no longer delays the other
+    logger.info("Racing airplanes.live and adsb.fi…")
+    aircraft = _race(_fetch_airplanes_live, partial(_fetch_adsb_fi, lamin, lomin, lamax, lomax))
 
-    # 2. OpenSky OAuth2
+    # 2. OpenSky (rate-limited, so only when both free sources came back empty)
     if not aircraft:
-        logger.info("Trying OpenSky (OAuth2)…")
+        logger.info("Trying OpenSky…")
         aircraft = _fetch_opensky(lamin, lomin, lamax, lomax)
 
     # 3. Mock
@@ -238,7 +623,6 @@ def fetch_opensky(lamin=-90, lomin=-180, lamax=90, lomax=180) -> list[dict]:
         logger.warning("All live sources failed — using mock data")
         aircraft = generate_mock_aircraft(500)
 
-    aviation_cache.set(cache_key, aircraft)
     return aircraft
 
 
@@ -247,7 +631,27 @@ def get_aircraft(bbox: dict | None = None) -> list[dict]:
     return fetch_opensky(**params) if params else fetch_opensky()
 
 
+# No indentation inside the markup: every popup is embedded in the map's GeoJSON
+_POPUP_TEMPLATE = (
+    "<div style='font-family:monospace;font-size:12px'>"
+    "<b>{callsign}</b> {icao24}<br>"
+    "{status} | {country}<br>"
+    "Squawk: {squawk} | {aircraft_type}<br>"
+    "Alt: {alt_ft:,.0f} ft<br>"
+    "Speed: {speed_kts:.0f} kts | Hdg: {heading:.0f}°"
+    "{mock_tag}</div>"
+)
+
+
 class Aircraft:
+    # Fixed attribute set: no per-instance __dict__ for the few hundred live objects
+    __slots__ = (
+        "icao24", "callsign", "origin_country", "latitude", "longitude",
+        "altitude_ft", "altitude_m", "velocity_kts", "heading", "vertical_rate",
+        "on_ground", "squawk", "aircraft_type", "last_contact", "is_mock",
+        "_popup",
+    )
+
     def __init__(self, data: dict):
         self.icao24         = data.get("icao24", "")
         self.callsign       = (data.get("callsign") or "UNKNOWN").strip()
@@ -281,26 +685,82 @@ class Aircraft:
         }
 
     @property
-    def popup_html(self):
-        status = "Ground" if self.on_ground else "Airborne"
-        mock_tag = "<br><em>Simulated</em>" if self.is_mock else ""
-        return f"""<div style='font-family:monospace;font-size:12px'>
-          <b>{self.callsign}</b> {self.icao24}<br>
-          {status} | {self.origin_country}<br>
-          Squawk: {self.squawk} | {self.aircraft_type}<br>
-          Alt: {self.altitude_ft:,.0f} ft<br>
-          Speed: {self.velocity_kts:.0f} kts | Hdg: {self.heading:.0f}°
-          {mock_tag}</div>"""
+    def popup_html(self) -> str:
+        """Popup markup; built on first access and kept, as the worker snapshot outlives many reruns."""
+        try:
+            return self._popup
+        except AttributeError:
+            self._popup = _POPUP_TEMPLATE.format(
+                callsign=self.callsign,
+                icao24=self.icao24,
+                status="Ground" if self.on_ground else "Airborne",
+                country=self.origin_country,
+                squawk=self.squawk,
+                aircraft_type=self.aircraft_type,
+                alt_ft=self.altitude_ft,
+                speed_kts=self.velocity_kts,
+                heading=self.heading,
+                mock_tag="<br><em>Simulated</em>" if self.is_mock else "",
+            )
+            return self._popup
 
 
 def fetch_aircraft(bbox=None):
+    """
+    Returns ``(aircraft, columns, is_live)``: the per-marker ``Aircraft``
+    objects plus their column-oriented view (see ``aircraft_columns``), which
+    bulk consumers — metrics, table, anomaly scan — should prefer.
+    """
     raw = get_aircraft(bbox)
-    aircraft = [Aircraft(a) for a in raw[:500]]
-    is_live = any(not a.is_mock for a in aircraft)
-    return aircraft, is_live
+    aircraft = [Aircraft(a) for a in raw[:MAX_AIRCRAFT]]
+    columns = aircraft_columns(aircraft)
+    is_live = not columns["is_mock"].all() if aircraft else False
+    return aircraft, columns, is_live
+
+
+def aircraft_payload(aircraft: list[Aircraft]) -> bytes:
+    """
+    The aircraft list as UTF-8 JSON (a list of ``to_dict()`` records), encoded
+    once per fetch so exports and API-style consumers can hand the bytes on as is.
+    """
+    return _dumps([a.to_dict() for a in aircraft])
+
+
+# Column name → (Aircraft attribute, dtype), in to_dict() order. Squawks are a
+# fixed-width str column so emergency scans are a native compare, not per-object;
+# kinematics need no more than float32, positions keep float64 for the map.
+_COLUMNS = {
+    "callsign":  ("callsign",       object),
+    "country":   ("origin_country", object),
+    "alt_ft":    ("altitude_ft",    np.float32),
+    "speed_kts": ("velocity_kts",   np.float32),
+    "heading":   ("heading",        np.float32),
+    "on_ground": ("on_ground",      bool),
+    "squawk":    ("squawk",         str),
+    "type":      ("aircraft_type",  object),
+    "lat":       ("latitude",       np.float64),
+    "lon":       ("longitude",      np.float64),
+    "is_mock":   ("is_mock",        bool),
+}
+_row_getter = attrgetter(*(attr for attr, _ in _COLUMNS.values()))
+
+
+def aircraft_columns(aircraft: list[Aircraft]) -> dict[str, np.ndarray]:
+    """
+    Column-oriented (SoA) view of an aircraft list, keyed like ``Aircraft.to_dict()``.
+    Built once per fetch so metrics and tables work on whole arrays instead of
+    touching every Aircraft object on each rerun.
+    """
+    # One attrgetter call per aircraft, then transpose rows into columns
+    columns = list(zip(*map(_row_getter, aircraft))) or [()] * len(_COLUMNS)
+    return {
+        name: np.array(values, dtype=dtype)
+        for (name, (_, dtype)), values in zip(_COLUMNS.items(), columns)
+    }
 
 
-EMERGENCY_SQUAWKS = {"7700", "7600", "7500"}
+EMERGENCY_SQUAWKS = frozenset({"7700", "7600", "7500"})
+_EMERGENCY_SQUAWK_ARRAY = np.array(sorted(EMERGENCY_SQUAWKS))
 SQUAWK_LABELS = {
     "7700": "General Emergency",
     "7600": "Radio Failure",
@@ -308,19 +768,39 @@ SQUAWK_LABELS = {
 }
 
 
-def check_aviation_anomalies(aircraft):
+def check_aviation_anomalies(aircraft, columns: dict[str, np.ndarray] | None = None):
+    """
+    Emergency-squawk scan over ``Aircraft`` objects or raw aircraft dicts. With
+    ``columns`` (from ``aircraft_columns``) the squawk test is a single
+    ``np.isin`` over the column; only hits touch the per-aircraft objects.
+    """
+    if not aircraft:
+        return []
+    # One type check for the whole list: dict.get and getattr share a signature
+    field = dict.get if isinstance(aircraft[0], dict) else getattr
+
+    if columns is not None:
+        squawks = columns["squawk"].astype(str, copy=False)
+    else:
+        squawks = np.array([str(field(ac, "squawk", "----")) for ac in aircraft], dtype=str)
+    # A padded emergency code is at least 5 chars; a column no wider than 4
+    # (the usual case, "----" included) has nothing to strip
+    if squawks.dtype.itemsize > np.dtype("U4").itemsize:
+        squawks = np.char.strip(squawks)
+
     anomalies = []
-    for ac in aircraft:
-        squawk = str(ac.squawk if hasattr(ac, "squawk") else ac.get("squawk", "----")).strip()
-        if squawk in EMERGENCY_SQUAWKS:
-            anomalies.append({
-                "icao24":    ac.icao24 if hasattr(ac, "icao24") else ac.get("icao24"),
-                "callsign":  ac.callsign if hasattr(ac, "callsign") else ac.get("callsign"),
-                "squawk":    squawk,
-                "label":     SQUAWK_LABELS.get(squawk, "Emergency"),
-                "latitude":  ac.latitude if hasattr(ac, "latitude") else ac.get("latitude", 0.0),
-                "longitude": ac.longitude if hasattr(ac, "longitude") else ac.get("longitude", 0.0),
-                "level":     "CRITICAL",
-                "message":   f"{ac.callsign if hasattr(ac, 'callsign') else ac.get('callsign')} squawking {squawk} ({SQUAWK_LABELS.get(squawk, 'Emergency')})",
-            })
+    for i in np.flatnonzero(np.isin(squawks, _EMERGENCY_SQUAWK_ARRAY)).tolist():
+        ac, squawk = aircraft[i], str(squawks[i])
+        label = SQUAWK_LABELS.get(squawk, "Emergency")
+        callsign = field(ac, "callsign", None)
+        anomalies.append({
+            "icao24":    field(ac, "icao24", None),
+            "callsign":  callsign,
+            "squawk":    squawk,
+            "label":     label,
+            "latitude":  field(ac, "latitude", 0.0),
+            "longitude": field(ac, "longitude", 0.0),
+            "level":     "CRITICAL",
+            "message":   f"{callsign} squawking {squawk} ({label})",
+        })
     return anomalies
@@ -0,0 +1,75 @@
+"""
+AetherWatch — Aviation Background Worker
+Refreshes the aircraft snapshot on a daemon thread so dashboard reruns never
+block on network I/O. Readers always get the latest completed snapshot.
+"""
+
+import threading
+import time
+from functools import cache, partial
+from typing import Callable
+
+from config.settings import CACHE_TTL_AVIATION
+from data_sources.aviation import (
+    fetch_aircraft, aircraft_columns, aircraft_payload, check_aviation_anomalies,
+)
+from utils.alerts import dispatch_alerts_bulk
+from utils.logger import logger
+
+_lock = threading.Lock()
+_ready = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def _lazy_payload(aircraft: list) -> Callable[[], bytes]:
+    """JSON for ``aircraft``, encoded on first call (a download) and then kept."""
+    return cache(partial(aircraft_payload, aircraft))
+
+
+# (aircraft, columns, is_live, anomalies, fetched_at, payload)
+_snapshot: tuple = ([], aircraft_columns([]), False, [], 0.0, _lazy_payload([]))
+
+
+def _refresh():
+    global _snapshot
+    aircraft, columns, is_live = fetch_aircraft()
+    anomalies = check_aviation_anomalies(aircraft, columns)
+    dispatch_alerts_bulk([(a["level"], "Aviation Anomaly", a["message"]) for a in anomalies])
+
+    with _lock:
+        _snapshot = (aircraft, columns, is_live, anomalies, time.time(), _lazy_payload(aircraft))
+    _ready.set()
+
+
+def _loop(interval: float):
+    while True:
+        try:
+            _refresh()
+        except Exception as e:
+            logger.error("Aviation worker refresh failed: {}", e)
+        time.sleep(interval)
+
+
+def start(interval: float = CACHE_TTL_AVIATION) -> threading.Thread:
+    """Start the refresh thread once per process. Safe to call repeatedly."""
+    global _thread
+    with _lock:
+        if _thread is None or not _thread.is_alive():
+            _thread = threading.Thread(
+                target=_loop, args=(interval,), name="aviation-worker", daemon=True
+            )
+            _thread.start()
+            logger.info("Aviation worker started (every {}s)", interval)
+    return _thread
+
+
+def get_snapshot(timeout: float = 30.0) -> tuple:
+    """
+    Return the latest ``(aircraft, columns, is_live, anomalies, fetched_at, payload)``
+    snapshot, where ``payload()`` gives the JSON bytes of exactly these aircraft.
+    Only blocks until the very first fetch completes (or ``timeout`` elapses).
+    """
+    _ready.wait(timeout)
+    with _lock:
+        return _snapshot
+
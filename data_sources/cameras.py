@@ -11,7 +11,9 @@ import io
 import time
 import random
 import colorsys
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 from typing import Optional
@@ -23,6 +25,24 @@ log = get_logger(__name__)
 # Connection timeout for camera URLs
 CAMERA_TIMEOUT = 6  # seconds
 
+# Frames are shown (and run through YOLO) at this size, so there is no point
+# decoding a 1080p JPEG at full resolution
+FRAME_DECODE_SIZE = (640, 360)
+
+# One keep-alive session for every camera host: repeat polls skip the TCP/TLS
+# handshake, which costs more than the frame itself on most snapshot feeds
+_session = requests.Session()
+_session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; AetherWatch/1.0)"})
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=8)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Loaded once; load_default re-reads the bundled font on every call
+try:
+    _HUD_FONT = ImageFont.load_default()
+except Exception:
+    _HUD_FONT = None
+
 # Per-camera state: tracks offline status to reduce spam logging
 _camera_status: dict[str, dict] = {}
 
@@ -67,13 +87,26 @@ def fetch_camera_frame(camera: dict) -> tuple[Optional[Image.Image], bool]:
     return _generate_mock_frame(camera), False
 
 
+# Last decoded frame per static URL with its validators: (etag, last_modified, image).
+# Lets unchanged snapshots come back as a body-less 304 and skip the decode too.
+_static_frames: dict[str, tuple[Optional[str], Optional[str], Image.Image]] = {}
+
+
 def _fetch_static_frame(url: str) -> Optional[Image.Image]:
-    """Fetch a static JPEG/PNG image from a URL."""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; AetherWatch/1.0)",
-        "Cache-Control": "no-cache",
-    }
-    resp = requests.get(url, timeout=CAMERA_TIMEOUT, headers=headers, stream=True)
+    """Fetch a static JPEG/PNG image from a URL (conditional GET when possible)."""
+    headers = {"Cache-Control": "no-cache"}
+    cached = _static_frames.get(url)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    resp = _session.get(url, timeout=CAMERA_TIMEOUT, headers=headers, stream=True)
+    if resp.status_code == 304 and cached is not None:
+        resp.close()
+        return cached[2]
     resp.raise_for_status()
     
     # Check content type
@@ -81,48 +114,74 @@ def _fetch_static_frame(url: str) -> Optional[Image.Image]:
     if "image" not in content_type and "jpeg" not in content_type:
         raise ValueError(f"Unexpected content type: {content_type}")
     
-    img = Image.open(io.BytesIO(resp.content))
-    img = img.convert("RGB")
+    img = _decode_frame(resp.content)
+    etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _static_frames[url] = (etag, last_modified, img)
     return img
 
 
+# Reused MJPEG receive buffers keyed by stream URL. A buffer is popped while a
+# fetch uses it, so concurrent sessions never share one.
+MJPEG_MAX_BYTES = 1_000_000  # 1MB limit per frame
+_mjpeg_buffers: dict[str, bytearray] = {}
+
+
 def _fetch_mjpeg_frame(url: str) -> Optional[Image.Image]:
     """
     Grab a single frame from an MJPEG stream.
     Reads until we find a complete JPEG frame (starts with FF D8, ends with FF D9).
+    Chunks are copied into a preallocated per-stream buffer instead of growing
+    a new bytes object on every chunk, and each chunk's bytes are scanned once.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (compatible; AetherWatch/1.0)",
-    }
-    with requests.get(url, timeout=CAMERA_TIMEOUT, headers=headers, stream=True) as resp:
-        resp.raise_for_status()
-        
-        buffer = b""
-        bytes_read = 0
-        max_bytes = 1_000_000  # 1MB limit per frame
-        
-        for chunk in resp.iter_content(chunk_size=4096):
-            buffer += chunk
-            bytes_read += len(chunk)
-            
-            # Look for JPEG start (FF D8) and end (FF D9)
-            start = buffer.find(b'\xff\xd8')
-            end = buffer.find(b'\xff\xd9', start + 2) if start != -1 else -1
-            
-            if start != -1 and end != -1:
-                jpeg_data = buffer[start:end + 2]
-                img = Image.open(io.BytesIO(jpeg_data)).convert("RGB")
-                return img
+    buffer = _mjpeg_buffers.pop(url, None) or bytearray(MJPEG_MAX_BYTES)
+    try:
+        with _session.get(url, timeout=CAMERA_TIMEOUT, stream=True) as resp:
+            resp.raise_for_status()
             
-            if bytes_read > max_bytes:
-                raise ValueError("MJPEG frame exceeded 1MB limit")
+            filled = 0
+            start = -1
+            search_pos = 0  # everything before this has already been scanned
+            for chunk in resp.iter_content(chunk_size=4096):
+                n = len(chunk)
+                if filled + n > MJPEG_MAX_BYTES:
+                    raise ValueError("MJPEG frame exceeded 1MB limit")
+                buffer[filled:filled + n] = chunk
+                filled += n
+                
+                # Look for JPEG start (FF D8), then end (FF D9), in the new bytes
+                # only — backing up one in case a marker straddles two chunks
+                if start == -1:
+                    start = buffer.find(b'\xff\xd8', search_pos, filled)
+                    search_pos = filled - 1 if start == -1 else start + 2
+                if start != -1:
+                    end = buffer.find(b'\xff\xd9', search_pos, filled)
+                    if end != -1:
+                        with memoryview(buffer) as view:
+                            return _decode_frame(view[start:end + 2])
+                    search_pos = max(filled - 1, start + 2)
+    finally:
+        _mjpeg_buffers[url] = buffer
     
     return None
 
 
+def _decode_frame(data: bytes | memoryview) -> Image.Image:
+    """
+    Decode a JPEG/PNG frame to RGB.
+    
+    Pillow's JPEG decoder is libjpeg-turbo (SIMD IDCT); ``draft()`` additionally
+    lets it scale by 1/2, 1/4 or 1/8 in the DCT domain while decoding, so large
+    frames never get fully decoded just to be shrunk afterwards.
+    """
+    img = Image.open(io.BytesIO(data))
+    img.draft("RGB", FRAME_DECODE_SIZE)
+    return img.convert("RGB")
+
+
 def get_all_cameras() -> list[dict]:
-    """Return the full list of configured public cameras."""
-    return settings.PUBLIC_CAMERAS
+    """Return the configured public cameras as a fresh list (safe to extend)."""
+    return list(settings.PUBLIC_CAMERAS)
 
 
 def get_camera_status() -> dict[str, dict]:
@@ -135,6 +194,9 @@ def get_camera_status() -> dict[str, dict]:
 # Persistent state per camera for continuous simulation
 _mock_state: dict[str, dict] = {}
 
+# Static scene backgrounds keyed by (width, height, time_of_day)
+_bg_cache: dict[tuple, Image.Image] = {}
+
 
 def _generate_mock_frame(camera: dict, width: int = 640, height: int = 360) -> Image.Image:
     """
@@ -159,16 +221,10 @@ def _generate_mock_frame(camera: dict, width: int = 640, height: int = 360) -> I
     # Update vehicle positions
     state["vehicles"] = _update_mock_vehicles(state["vehicles"], width, height, now)
     
-    img = Image.new("RGB", (width, height))
+    # Static sky/road/buildings, drawn once; each frame starts from a copy
+    img = _mock_background(width, height, state["time_of_day"]).copy()
     draw = ImageDraw.Draw(img)
     
-    # Sky gradient based on time of day
-    tod = state["time_of_day"]
-    _draw_sky(draw, width, height, tod)
-    
-    # Road / scene
-    _draw_road_scene(draw, width, height)
-    
     # Vehicles
     for v in state["vehicles"]:
         _draw_vehicle(draw, v)
@@ -176,12 +232,26 @@ def _generate_mock_frame(camera: dict, width: int = 640, height: int = 360) -> I
     # Overlay: camera info banner
     _draw_hud(draw, camera, width, height)
     
-    # Slight blur for realism
-    img = img.filter(ImageFilter.GaussianBlur(radius=0.5))
-    
     return img
 
 
+def _mock_background(width: int, height: int, hour: int) -> Image.Image:
+    """
+    Sky, road and building silhouettes for a frame size and time of day.
+    None of it moves (the skyline has a fixed seed), so cameras share it.
+    """
+    key = (width, height, hour)
+    bg = _bg_cache.get(key)
+    if bg is None:
+        bg = Image.new("RGB", (width, height))
+        _draw_sky(bg, width, height, hour)
+        _draw_road_scene(ImageDraw.Draw(bg), width, height)
+        # Soften once here; per-frame vehicles and the HUD are drawn crisp on top
+        bg = bg.filter(ImageFilter.GaussianBlur(radius=0.5))
+        _bg_cache[key] = bg
+    return bg
+
+
 def _init_mock_vehicles(seed: int, width: int, height: int) -> list[dict]:
     """Initialise random vehicles for the mock scene."""
     rng = random.Random(seed)
@@ -214,8 +284,8 @@ def _update_mock_vehicles(vehicles: list, width: int, height: int, t: float) ->
     return vehicles
 
 
-def _draw_sky(draw: ImageDraw.Draw, width: int, height: int, hour: int):
-    """Draw a sky gradient appropriate for the time of day."""
+def _draw_sky(img: Image.Image, width: int, height: int, hour: int):
+    """Paint a sky gradient appropriate for the time of day."""
     if 5 <= hour < 7:          # dawn
         top_col, bot_col = (255, 140, 0), (255, 200, 100)
     elif 7 <= hour < 18:       # day
@@ -226,12 +296,12 @@ def _draw_sky(draw: ImageDraw.Draw, width: int, height: int, hour: int):
         top_col, bot_col = (5, 5, 20), (20, 20, 60)
     
     sky_h = int(height * 0.45)
-    for y in range(sky_h):
-        ratio = y / sky_h
-        r = int(top_col[0] + (bot_col[0] - top_col[0]) * ratio)
-        g = int(top_col[1] + (bot_col[1] - top_col[1]) * ratio)
-        b = int(top_col[2] + (bot_col[2] - top_col[2]) * ratio)
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    # Every row colour in one vector op, as a 1-px-wide column that Pillow
+    # stretches across the width (no per-row draw.line calls)
+    top = np.array(top_col, dtype=np.float64)
+    ratio = (np.arange(sky_h) / sky_h)[:, None]
+    column = (top + (np.array(bot_col) - top) * ratio).astype(np.uint8)
+    img.paste(Image.fromarray(column[:, None, :]).resize((width, sky_h), Image.NEAREST), (0, 0))
 
 
 def _draw_road_scene(draw: ImageDraw.Draw, width: int, height: int):
@@ -294,18 +364,20 @@ def _draw_vehicle(draw: ImageDraw.Draw, v: dict):
         draw.ellipse([wx, y - 3, wx + 6, y + 3], fill=(20, 20, 20))
 
 
+@lru_cache(maxsize=4)
+def _hud_timestamp(second: int) -> str:
+    """HUD clock text; every camera rendered within the same second shares it."""
+    return time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(second))
+
+
 def _draw_hud(draw: ImageDraw.Draw, camera: dict, width: int, height: int):
     """Draw camera HUD overlay (name, timestamp, MOCK indicator)."""
     # Semi-transparent top bar
     draw.rectangle([0, 0, width, 28], fill=(0, 0, 0))
     
-    ts = time.strftime("%Y-%m-%d %H:%M:%S UTC")
+    ts = _hud_timestamp(int(time.time()))
     name = camera.get("name", "Unknown Camera")
-    
-    try:
-        font = ImageFont.load_default()
-    except Exception:
-        font = None
+    font = _HUD_FONT
     
     draw.text((6, 6), f"📷 {name}  |  {ts}  |  ⚠ SIMULATED FEED", fill=(255, 60, 60), font=font)
     
@@ -22,6 +22,30 @@ from config import settings
 log = get_logger(__name__)
 
 
+# Constant part of every GIBS WMS GetMap request
+_WMS_BASE_PARAMS = {
+    "SERVICE": "WMS",
+    "VERSION": "1.1.1",
+    "REQUEST": "GetMap",
+    "STYLES": "",
+    "SRS": "EPSG:4326",
+    "FORMAT": "image/jpeg",
+    "TRANSPARENT": "FALSE",
+}
+
+
+def gibs_params(layer_name: str, date_str: str, bbox: tuple, width: int, height: int) -> dict:
+    """Build WMS GetMap parameters for one layer/date/bbox."""
+    return {
+        **_WMS_BASE_PARAMS,
+        "LAYERS": layer_name,
+        "BBOX": "{},{},{},{}".format(*bbox),
+        "WIDTH": str(width),
+        "HEIGHT": str(height),
+        "TIME": date_str,
+    }
+
+
 def fetch_gibs_image(
     layer_name: str,
     date: Optional[datetime.date] = None,
@@ -49,23 +73,8 @@ def fetch_gibs_image(
     if settings.FORCE_MOCK_DATA:
         return _generate_mock_satellite(layer_name, bbox, width, height), False
     
-    date_str = date.strftime("%Y-%m-%d")
-    
-    # Build WMS request parameters
-    params = {
-        "SERVICE": "WMS",
-        "VERSION": "1.1.1",
-        "REQUEST": "GetMap",
-        "LAYERS": layer_name,
-        "STYLES": "",
-        "SRS": "EPSG:4326",
-        "BBOX": f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}",
-        "WIDTH": str(width),
-        "HEIGHT": str(height),
-        "FORMAT": "image/jpeg",
-        "TRANSPARENT": "FALSE",
-        "TIME": date_str,
-    }
+    date_str = date.isoformat()
+    params = gibs_params(layer_name, date_str, bbox, width, height)
     
     try:
         log.info(f"Fetching NASA GIBS layer '{layer_name}' for {date_str}")
@@ -5,9 +5,11 @@ filterable by level, source, and time range.
 """
 
 import datetime
+
+import jinja2
 import streamlit as st
 import pandas as pd
-from utils.alerts import get_recent_alerts, clear_alerts, AlertLevel, AlertRecord
+from utils.alerts import get_recent_alerts, get_alert_counts, clear_alerts, AlertLevel, AlertRecord
 
 
 # ── Severity styling ──────────────────────────────────────────────────────────
@@ -20,33 +22,27 @@ LEVEL_STYLES = {
 }
 
 
-def _alert_card_html(alert: AlertRecord) -> str:
-    """Render an individual alert as a styled HTML card."""
-    style = LEVEL_STYLES.get(alert.level, LEVEL_STYLES[AlertLevel.INFO])
-    emoji = style["emoji"]
-    ts = alert.timestamp.strftime("%H:%M:%S")
-    
-    return f"""
-    <div style="
-        background:{style['bg']};
-        border-left: 3px solid {style['border']};
-        border-radius: 4px;
-        padding: 8px 12px;
-        margin-bottom: 6px;
-        font-family: monospace;
-        font-size: 12px;
-        color: #e6edf3;
-    ">
-        <span style="color:{style['border']}">{emoji} {alert.level}</span>
-        <span style="color:#8b949e; margin-left:8px">{ts} UTC</span>
-        <span style="color:#58a6ff; margin-left:8px">[{alert.source}]</span><br>
-        <span style="color:#e6edf3; margin-top:4px; display:block">{alert.message}</span>
-        {f'<span style="color:#8b949e; font-size:11px">{alert.details}</span>' if alert.details else ''}
-    </div>"""
+# Compiled once; autoescape keeps alert text (callsigns, API error strings) inert.
+_ALERT_CARDS = jinja2.Template(
+    """{% for a in alerts %}{% set s = styles.get(a.level, default) %}
+<div style="background:{{ s.bg }};border-left:3px solid {{ s.border }};border-radius:4px;padding:8px 12px;margin-bottom:6px;font-family:monospace;font-size:12px;color:#e6edf3;">
+<span style="color:{{ s.border }}">{{ s.emoji }} {{ a.level }}</span>
+<span style="color:#8b949e;margin-left:8px">{{ a.timestamp.strftime("%H:%M:%S") }} UTC</span>
+<span style="color:#58a6ff;margin-left:8px">[{{ a.source }}]</span><br>
+<span style="color:#e6edf3;margin-top:4px;display:block">{{ a.message }}</span>
+{% if a.details %}<span style="color:#8b949e;font-size:11px">{{ a.details }}</span>{% endif %}</div>{% endfor %}""",
+    autoescape=True,
+)
+
+
+def _alert_cards_html(alerts: list[AlertRecord]) -> str:
+    """Render a list of alerts as styled HTML cards."""
+    return _ALERT_CARDS.render(alerts=alerts, styles=LEVEL_STYLES, default=LEVEL_STYLES[AlertLevel.INFO])
 
 
+@st.fragment
 def render_alerts_panel():
-    """Render the full alerts and logs panel."""
+    """Render the full alerts and logs panel (as a fragment: filter changes rerun only this panel)."""
     st.subheader("🚨 Alerts & System Log")
     
     # Controls row
@@ -82,14 +78,14 @@ def render_alerts_panel():
         alerts = [a for a in alerts if src_filter in a.source.lower()]
     
     # Summary stats bar
-    all_alerts = get_recent_alerts(limit=200)
-    critical_count = sum(1 for a in all_alerts if a.level == AlertLevel.CRITICAL)
-    anomaly_count = sum(1 for a in all_alerts if a.level == AlertLevel.ANOMALY)
-    warning_count = sum(1 for a in all_alerts if a.level == AlertLevel.WARNING)
+    counts = get_alert_counts()
+    critical_count = counts.get(AlertLevel.CRITICAL, 0)
+    anomaly_count = counts.get(AlertLevel.ANOMALY, 0)
+    warning_count = counts.get(AlertLevel.WARNING, 0)
     
     stat_cols = st.columns(4)
     with stat_cols[0]:
-        st.metric("Total Events", len(all_alerts))
+        st.metric("Total Events", sum(counts.values()))
     with stat_cols[1]:
         st.metric("🚨 Critical", critical_count, delta=None if critical_count == 0 else f"+{critical_count}")
     with stat_cols[2]:
@@ -104,7 +100,7 @@ def render_alerts_panel():
         return
     
     # Render alert cards in a scrollable container
-    alert_html = "".join(_alert_card_html(a) for a in alerts)
+    alert_html = _alert_cards_html(alerts)
     st.markdown(
         f"""<div style="max-height:450px; overflow-y:auto; padding-right:4px">
             {alert_html}
@@ -123,6 +119,6 @@ def render_alerts_panel():
             st.download_button(
                 "⬇️ Download as CSV",
                 data=csv,
-                file_name=f"aetherwatch_alerts_{datetime.datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"aetherwatch_alerts_{datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv",
             )
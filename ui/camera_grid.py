@@ -6,6 +6,7 @@ Each panel shows: live/mock feed, detection boxes, anomaly indicators, FPS count
 
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional
 import streamlit as st
 from PIL import Image
@@ -13,6 +14,9 @@ from PIL import Image
 from data_sources.cameras import fetch_camera_frame, get_all_cameras
 from config import settings
 
+# Frames are fetched in parallel so a refresh takes as long as the slowest feed, not the sum
+_fetch_pool = ThreadPoolExecutor(max_workers=settings.CAMERA_GRID_MAX, thread_name_prefix="camera-fetch")
+
 
 def render_camera_grid(
     selected_camera_ids: list[str],
@@ -36,6 +40,14 @@ def render_camera_grid(
         st.info("📷 No cameras selected. Use the sidebar to choose camera feeds.")
         return
     
+    # Fetch every frame first so detection can run as a single batch
+    frames = list(_fetch_pool.map(_fetch_display_frame, selected))
+    
+    results = [None] * len(selected)
+    if detection_enabled and detector is not None:
+        batch = [i for i, (img, _, _) in enumerate(frames) if img is not None]
+        results = _detect_frames(detector, selected, frames, batch, results)
+    
     # Create grid columns
     grid_cols = st.columns(min(cols, len(selected)))
     
@@ -43,12 +55,61 @@ def render_camera_grid(
         col = grid_cols[idx % cols]
         
         with col:
-            _render_camera_panel(camera, detection_enabled, detector)
+            _render_camera_panel(camera, *frames[idx], results[idx], detection_enabled)
+
+
+def _detect_frames(detector, selected: list[dict], frames: list[tuple], batch: list[int], results: list) -> list:
+    """
+    Run detection for the grid without letting a slow model stall the refresh.
+    
+    A new batch is only submitted when the detector is idle, and we wait at
+    most YOLO_FRAME_BUDGET_S for it. Otherwise each panel reuses the camera's
+    last known detections, re-drawn on the current frame.
+    """
+    try:
+        future = detector.submit_batch(
+            [frames[i][0] for i in batch],
+            [selected[i]["id"] for i in batch],
+        )
+        if future is not None:
+            done, _ = wait([future], timeout=settings.YOLO_FRAME_BUDGET_S)
+            if done:
+                for i, result in zip(batch, future.result()):
+                    results[i] = result
+                return results
+        
+        for i in batch:
+            last = detector.latest_result(selected[i]["id"])
+            if last is not None:
+                results[i] = detector.overlay(last, frames[i][0])
+    except Exception:
+        pass  # Graceful degradation — show frames without detection
+    return results
+
+
+def _fetch_display_frame(camera: dict) -> tuple[Optional[Image.Image], bool, float]:
+    """Fetch a camera frame resized for display. Returns (image, is_live, fetch_ms)."""
+    t0 = time.time()
+    img, is_live = fetch_camera_frame(camera)
+    fetch_ms = (time.time() - t0) * 1000
+    
+    if img is not None:
+        # Resize for display
+        display_size = (640, 360)
+        img = img.resize(display_size, Image.LANCZOS)
+    
+    return img, is_live, fetch_ms
 
 
-def _render_camera_panel(camera: dict, detection_enabled: bool, detector):
-    """Render a single camera panel with frame and metadata."""
-    cam_id = camera["id"]
+def _render_camera_panel(
+    camera: dict,
+    img: Optional[Image.Image],
+    is_live: bool,
+    fetch_ms: float,
+    result,
+    detection_enabled: bool,
+):
+    """Render a single camera panel with frame, detection overlay and metadata."""
     cam_name = camera["name"]
     
     # Panel header
@@ -63,37 +124,24 @@ def _render_camera_panel(camera: dict, detection_enabled: bool, detector):
             unsafe_allow_html=True,
         )
         
-        # Fetch frame
-        t0 = time.time()
-        img, is_live = fetch_camera_frame(camera)
-        fetch_ms = (time.time() - t0) * 1000
-        
         if img is None:
             st.error(f"❌ Cannot load camera: {cam_name}")
             return
         
-        # Resize for display
-        display_size = (640, 360)
-        img = img.resize(display_size, Image.LANCZOS)
-        
-        # Run YOLO detection if enabled
+        # Apply YOLO detection result if available
         anomalies = []
         inference_ms = 0.0
         det_count = 0
         
-        if detection_enabled and detector is not None:
-            try:
-                result = detector.detect(img, camera_id=cam_id)
-                img = result.annotated_image or img
-                anomalies = result.anomalies
-                inference_ms = result.inference_ms
-                det_count = len(result.detections)
-                
-                # Show anomaly alerts inline
-                for anomaly in anomalies:
-                    st.warning(anomaly)
-            except Exception as e:
-                pass  # Graceful degradation — show frame without detection
+        if result is not None:
+            img = result.annotated_image or img
+            anomalies = result.anomalies
+            inference_ms = result.inference_ms
+            det_count = len(result.detections)
+            
+            # Show anomaly alerts inline
+            for anomaly in anomalies:
+                st.warning(anomaly)
         
         # Display the frame
         status_label = "🟢 LIVE" if is_live else "🟡 SIM"
@@ -1,47 +1,67 @@
 """
 AetherWatch — Interactive Map View
 Builds a Folium/Leaflet map with:
-- Aircraft positions (with directional airplane icons)
+- Aircraft positions (single canvas-rendered GeoJSON layer)
 - Traffic camera locations (clickable markers)
 - NASA GIBS satellite overlay via WMS tile layer
 """
 
-import math
 import folium
 import folium.plugins
-from folium import IFrame
+import numpy as np
 from typing import Optional
 from data_sources.aviation import Aircraft
 from config import settings
 
-# ── Airplane SVG icon factory ─────────────────────────────────────────────────
+# ── Aircraft GeoJSON layer ────────────────────────────────────────────────────
 
-def _airplane_svg(heading: float, color: str = "#58a6ff", size: int = 18) -> str:
-    """Generate a rotated SVG airplane icon for the given heading."""
-    return f"""
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"
-         width="{size}" height="{size}"
-         style="transform: rotate({heading}deg); display:inline-block">
-      <path fill="{color}" d="M21 16v-2l-8-5V3.5A1.5 1.5 0 0 0 11.5 2
-                              1.5 1.5 0 0 0 10 3.5V9l-8 5v2l8-2.5V19l-2 1.5V22l3.5-1 3.5 1v-1.5L13 19v-5.5z"/>
-    </svg>"""
+AIRCRAFT_COLORS = {
+    "mock":     "#d29922",   # yellow for mock
+    "ground":   "#8b949e",   # grey for ground
+    "airborne": "#58a6ff",   # blue for airborne
+}
 
 
-def _make_airplane_icon(heading: float, on_ground: bool = False, is_mock: bool = False) -> folium.DivIcon:
-    """Create a DivIcon for an aircraft marker."""
-    if is_mock:
-        color = "#d29922"   # yellow for mock
-    elif on_ground:
-        color = "#8b949e"   # grey for ground
-    else:
-        color = "#58a6ff"   # blue for airborne
-    
-    svg = _airplane_svg(heading, color)
-    return folium.DivIcon(
-        html=svg,
-        icon_size=(18, 18),
-        icon_anchor=(9, 9),
+def aircraft_geojson(aircraft_list: list[Aircraft], cols: dict) -> dict:
+    """
+    Encode all aircraft as one GeoJSON FeatureCollection.
+    
+    One canvas-rendered layer replaces thousands of individual DivIcon
+    markers, which keeps both the generated HTML and the browser DOM small.
+    
+    Args:
+        aircraft_list: Aircraft objects (for popup HTML)
+        cols:          Columnar view of the same list (see aircraft_columns)
+    """
+    lat, lon = cols["lat"], cols["lon"]
+    valid = (np.abs(lat) <= 90) & (np.abs(lon) <= 180)
+    colors = np.where(
+        cols["is_mock"], AIRCRAFT_COLORS["mock"],
+        np.where(cols["on_ground"], AIRCRAFT_COLORS["ground"], AIRCRAFT_COLORS["airborne"]),
     )
+    
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [x, y]},
+            "properties": {
+                "tooltip": f"{ac.callsign} | {ac.altitude_ft:,.0f}ft | {ac.velocity_kts:.0f}kts",
+                "popup": ac.popup_html,
+                "color": color,
+                "is_mock": ac.is_mock,
+            },
+        }
+        for ac, y, x, color, ok in zip(
+            aircraft_list, lat.tolist(), lon.tolist(), colors.tolist(), valid.tolist()
+        )
+        if ok
+    ]
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _aircraft_style(feature: dict) -> dict:
+    color = feature["properties"]["color"]
+    return {"color": color, "fillColor": color}
 
 
 # ── Camera marker ─────────────────────────────────────────────────────────────
@@ -56,7 +76,7 @@ def _camera_icon(is_online: bool = True) -> folium.DivIcon:
 # ── Main map builder ──────────────────────────────────────────────────────────
 
 def build_map(
-    aircraft_list: list[Aircraft],
+    aircraft_geojson: Optional[dict],
     cameras: list[dict],
     tile_style: str = settings.DEFAULT_MAP_TILE,
     show_aircraft: bool = True,
@@ -71,7 +91,7 @@ def build_map(
     Build and return a fully configured Folium map.
     
     Args:
-        aircraft_list:           List of Aircraft objects to plot
+        aircraft_geojson:        FeatureCollection from aircraft_geojson()
         cameras:                 List of camera dicts to plot
         tile_style:              Base map tile style name
         show_aircraft:           Toggle aircraft markers
@@ -127,37 +147,29 @@ def build_map(
         except Exception:
             pass  # WMS overlay is best-effort
     
-    # ── Aircraft markers
-    if show_aircraft and aircraft_list:
-        if cluster_aircraft and len(aircraft_list) > 100:
+    # ── Aircraft layer
+    features = (aircraft_geojson or {}).get("features", [])
+    if show_aircraft and features:
+        aircraft_layer = folium.GeoJson(
+            aircraft_geojson,
+            name="Aircraft",
+            marker=folium.CircleMarker(radius=4, fill=True, fill_opacity=0.9, weight=1),
+            style_function=_aircraft_style,
+            tooltip=folium.GeoJsonTooltip(fields=["tooltip"], labels=False, sticky=True),
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False, max_width=220),
+        )
+        if cluster_aircraft and len(features) > 100:
             aircraft_group = folium.plugins.MarkerCluster(
                 name="Aircraft",
                 overlay=True,
                 control=True,
                 options={"maxClusterRadius": 40, "disableClusteringAtZoom": 6},
             )
+            aircraft_layer.control = False
+            aircraft_layer.add_to(aircraft_group)
+            aircraft_group.add_to(m)
         else:
-            aircraft_group = folium.FeatureGroup(name="Aircraft", show=True)
-        
-        for ac in aircraft_list:
-            if not (-90 <= ac.latitude <= 90 and -180 <= ac.longitude <= 180):
-                continue
-            
-            icon = _make_airplane_icon(ac.heading, ac.on_ground, ac.is_mock)
-            popup = folium.Popup(IFrame(ac.popup_html, width=220, height=200), max_width=220)
-            tooltip = folium.Tooltip(
-                f"{ac.callsign} | {ac.altitude_ft:,.0f}ft | {ac.velocity_kts:.0f}kts",
-                sticky=True,
-            )
-            
-            folium.Marker(
-                location=[ac.latitude, ac.longitude],
-                icon=icon,
-                popup=popup,
-                tooltip=tooltip,
-            ).add_to(aircraft_group)
-        
-        aircraft_group.add_to(m)
+            aircraft_layer.add_to(m)
     
     # ── Camera markers
     if show_cameras and cameras:
@@ -202,16 +214,16 @@ def build_map(
     folium.LayerControl(position="topright", collapsed=False).add_to(m)
     
     # ── Stats legend
-    live_count = sum(1 for ac in aircraft_list if not ac.is_mock)
-    mock_count = sum(1 for ac in aircraft_list if ac.is_mock)
+    mock_count = sum(1 for f in features if f["properties"]["is_mock"])
+    live_count = len(features) - mock_count
     
     legend_html = f"""
     <div style="position:fixed; bottom:30px; left:10px; z-index:1000;
                 background:#161b22; border:1px solid #30363d; border-radius:8px;
                 padding:10px; font-family:monospace; font-size:12px; color:#e6edf3">
       <b>🛰️ AetherWatch</b><br>
-      ✈️ Aircraft: <b>{len(aircraft_list)}</b>
-        {'(live)' if live_count == len(aircraft_list) else f'({live_count} live, {mock_count} simulated)'}<br>
+      ✈️ Aircraft: <b>{len(features)}</b>
+        {'(live)' if live_count == len(features) else f'({live_count} live, {mock_count} simulated)'}<br>
       📷 Cameras: <b>{len(cameras)}</b><br>
       <span style="color:#d29922">■</span> Simulated &nbsp;
       <span style="color:#58a6ff">■</span> Live &nbsp;
@@ -32,7 +32,7 @@ def render_satellite_panel(detector=None, detection_enabled: bool = False):
     
     with ctrl2:
         available_dates = get_available_dates(layer_id)
-        date_options = [d.strftime("%Y-%m-%d") for d in available_dates]
+        date_options = [d.isoformat() for d in available_dates]
         selected_date_str = st.selectbox(
             "Date",
             date_options,
@@ -9,6 +9,9 @@ Respect GDPR, CCPA, and applicable local privacy laws.
 
 import smtplib
 import datetime
+import threading
+from collections import Counter, deque
+from itertools import chain, islice
 from email.mime.text import MIMEText
 from typing import Optional
 from utils.logger import get_logger
@@ -16,6 +19,8 @@ from config import settings
 
 log = get_logger(__name__)
 
+_UTC = datetime.timezone.utc
+
 
 class AlertLevel:
     INFO = "ℹ️ INFO"
@@ -26,12 +31,14 @@ class AlertLevel:
 
 class AlertRecord:
     """Represents a single alert event."""
+    __slots__ = ("level", "source", "message", "details", "timestamp")
+
     def __init__(self, level: str, source: str, message: str, details: Optional[str] = None):
         self.level = level
         self.source = source
         self.message = message
         self.details = details
-        self.timestamp = datetime.datetime.utcnow()
+        self.timestamp = datetime.datetime.now(_UTC)
 
     def to_dict(self) -> dict:
         return {
@@ -48,8 +55,27 @@ class AlertRecord:
 
 # ── In-App Alert Log (session state managed by app.py) ───────────────────────
 
-_in_memory_log: list[AlertRecord] = []
-MAX_LOG_SIZE = 100
+# Most severe first
+_SEVERITY = (AlertLevel.CRITICAL, AlertLevel.ANOMALY, AlertLevel.WARNING, AlertLevel.INFO)
+
+
+def _log_fn(level: str):
+    """Logger method matching an alert level."""
+    if level in (AlertLevel.WARNING, AlertLevel.ANOMALY):
+        return log.warning
+    return log.error if level == AlertLevel.CRITICAL else log.info
+
+
+MAX_LOG_SIZE = settings.MAX_ALERT_LOG_SIZE
+# Ring buffer: appends are O(1) and the oldest record drops off automatically
+_in_memory_log: deque[AlertRecord] = deque(maxlen=MAX_LOG_SIZE)
+
+# Per-level counts of _in_memory_log, kept in step with every append/evict
+_level_counts: Counter = Counter()
+
+# The aviation worker thread dispatches while script threads read: every
+# touch of the log and its counts goes through this lock
+_log_lock = threading.Lock()
 
 
 def dispatch_alert(
@@ -67,19 +93,18 @@ def dispatch_alert(
     record = AlertRecord(level, source, message, details)
     
     # 1. Always log
-    log_fn = log.warning if level in (AlertLevel.WARNING, AlertLevel.ANOMALY) else (
-        log.error if level == AlertLevel.CRITICAL else log.info
-    )
-    log_fn(str(record))
+    _log_fn(level)(str(record))
     
     # 2. Add to in-memory log (ring buffer)
-    _in_memory_log.append(record)
-    if len(_in_memory_log) > MAX_LOG_SIZE:
-        _in_memory_log.pop(0)
+    with _log_lock:
+        if len(_in_memory_log) == MAX_LOG_SIZE:
+            _level_counts[_in_memory_log[0].level] -= 1
+        _in_memory_log.append(record)
+        _level_counts[level] += 1
     
     # 3. Optional: Email (SMTP)
     if send_email and settings.SMTP_USER:
-        _send_email(record)
+        _send_email([record])
     
     # 4. Optional: Twilio SMS
     if send_sms and settings.TWILIO_ACCOUNT_SID:
@@ -88,30 +113,86 @@ def dispatch_alert(
     return record
 
 
+def dispatch_alerts_bulk(
+    alerts: list[tuple[str, str, str]],
+    send_email: bool = False,
+    send_sms: bool = False,
+) -> list[AlertRecord]:
+    """
+    Dispatch a burst of ``(level, source, message)`` alerts in one go.
+    
+    Same channels as dispatch_alert, but the burst costs one log write,
+    one ring-buffer update and at most one SMTP session / SMS, rather than
+    one of each per alert.
+    """
+    records = [AlertRecord(level, source, message) for level, source, message in alerts]
+    if not records:
+        return records
+    
+    # 1. One log entry at the burst's most severe level
+    levels = {r.level for r in records}
+    worst = next((lvl for lvl in _SEVERITY if lvl in levels), records[0].level)
+    _log_fn(worst)("\n".join(str(r) for r in records))
+    
+    # 2. Add to in-memory log (ring buffer)
+    with _log_lock:
+        overflow = len(_in_memory_log) + len(records) - MAX_LOG_SIZE
+        if overflow > 0:
+            _level_counts.subtract(r.level for r in islice(chain(_in_memory_log, records), overflow))
+        _in_memory_log.extend(records)
+        _level_counts.update(r.level for r in records)
+    
+    # 3. Optional: Email (SMTP)
+    if send_email and settings.SMTP_USER:
+        _send_email(records)
+    
+    # 4. Optional: Twilio SMS — one summary message for the burst
+    if send_sms and settings.TWILIO_ACCOUNT_SID:
+        _send_sms(records[0] if len(records) == 1 else AlertRecord(
+            worst, "AetherWatch", f"{len(records)} alerts: " + "; ".join(r.message for r in records[:3])
+        ))
+    
+    return records
+
+
 def get_recent_alerts(limit: int = 50) -> list[AlertRecord]:
     """Retrieve the most recent alerts (newest first)."""
-    return list(reversed(_in_memory_log[-limit:]))
+    with _log_lock:
+        return list(islice(reversed(_in_memory_log), limit))
+
+
+def get_alert_counts() -> dict[str, int]:
+    """Number of logged alerts per level, without scanning the log."""
+    with _log_lock:
+        return dict(+_level_counts)
 
 
 def clear_alerts():
     """Clear the in-memory alert log."""
-    _in_memory_log.clear()
+    with _log_lock:
+        _in_memory_log.clear()
+        _level_counts.clear()
 
 
 # ── Email Dispatch ────────────────────────────────────────────────────────────
 
-def _send_email(record: AlertRecord):
-    """Send alert via SMTP. Silently fails if not configured."""
+def _send_email(records: list[AlertRecord]):
+    """Send one or more alerts in a single SMTP email. Silently fails if not configured."""
     try:
-        msg = MIMEText(
-            f"AetherWatch Alert\n\n"
+        body = "\n\n".join(
             f"Time: {record.timestamp}\n"
             f"Level: {record.level}\n"
             f"Source: {record.source}\n"
             f"Message: {record.message}\n"
             f"Details: {record.details or 'N/A'}"
+            for record in records
+        )
+        msg = MIMEText(f"AetherWatch Alert\n\n{body}")
+        first = records[0]
+        msg["Subject"] = (
+            f"[AetherWatch] {first.level} — {first.source}" if len(records) == 1
+            else f"[AetherWatch] {len(records)} alerts — {first.source}"
         )
-        msg["Subject"] = f"[AetherWatch] {record.level} — {record.source}"
         msg["From"] = settings.SMTP_USER
         msg["To"] = settings.ALERT_EMAIL_TO
 
@@ -1,6 +1,7 @@
 """
 AetherWatch — Thread-safe TTL Cache
 Wraps cachetools.TTLCache with a threading.Lock for safe concurrent access.
+Optionally backed by Redis (REDIS_URL) for data shared across worker processes.
 """
 
 import threading
@@ -8,6 +9,26 @@ import time
 from typing import Any, Callable
 from cachetools import TTLCache
 
+try:
+    import redis  # optional: only needed when REDIS_URL is set
+except ImportError:
+    redis = None
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+from config import settings
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
 
 class SafeTTLCache:
     """Thread-safe TTL cache with optional fallback value on miss."""
@@ -49,10 +70,58 @@ class SafeTTLCache:
             self._cache.clear()
 
 
+class SharedJSONCache:
+    """
+    JSON-serialisable values in Redis, shared by every Streamlit worker process
+    so upstream APIs are polled once per TTL rather than once per process.
+    Disabled — every lookup misses, every store is dropped — when no URL is
+    configured, the redis package is missing or the server is unreachable.
+    """
+
+    def __init__(self, url: str, prefix: str = "aetherwatch:"):
+        self._prefix = prefix
+        self._client = None
+        if not url:
+            return
+        if redis is None:
+            log.warning("REDIS_URL is set but the redis package is not installed — shared cache disabled")
+            return
+        try:
+            client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            client.ping()
+            self._client = client
+            log.info("Shared Redis cache connected")
+        except Exception as e:
+            log.warning(f"Redis unavailable ({type(e).__name__}) — shared cache disabled")
+
+    @property
+    def enabled(self) -> bool:
+        return self._client is not None
+
+    def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Values for ``keys`` in one round trip (MGET); None for each miss."""
+        if self._client is None or not keys:
+            return [None] * len(keys)
+        try:
+            raw = self._client.mget([self._prefix + k for k in keys])
+        except Exception:
+            return [None] * len(keys)
+        return [None if r is None else _loads(r) for r in raw]
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        if self._client is None:
+            return
+        try:
+            self._client.setex(self._prefix + key, ttl, _dumps(value))
+        except Exception:
+            pass
+
+
 # Module-level shared caches
 aviation_cache = SafeTTLCache(maxsize=10, ttl=15)
 satellite_cache = SafeTTLCache(maxsize=20, ttl=300)
 camera_cache = SafeTTLCache(maxsize=30, ttl=10)
+shared_cache = SharedJSONCache(settings.REDIS_URL)
 
 
 def cached(ttl: int = 60):
@@ -64,10 +133,10 @@ def cached(ttl: int = 60):
             key = str(args) + str(kwargs)
             if key in _store:
                 result, ts = _store[key]
-                if time.time() - ts < ttl:
+                if time.monotonic() - ts < ttl:
                     return result
             result = fn(*args, **kwargs)
-            _store[key] = (result, time.time())
+            _store[key] = (result, time.monotonic())
             return result
         return wrapper
     return decorator
@@ -0,0 +1,36 @@
+"""
+AetherWatch — Optional Numba JIT
+``njit`` mirrors numba's decorator when numba is installed. Callers check
+``NUMBA_AVAILABLE`` and keep a NumPy fallback, since the pure-Python form of a
+per-element kernel is far too slow to use un-jitted.
+
+numba itself is only located at import time, not imported: importing it costs
+more than the rest of the app's startup, so that (and compilation) waits until
+a decorated kernel is first called.
+"""
+
+import importlib.util
+from functools import wraps
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def njit(*args, **kwargs):
+    """numba.njit (bare or with options), deferred to the first call."""
+    def decorate(fn):
+        if not NUMBA_AVAILABLE:
+            return fn
+        compiled = None
+
+        @wraps(fn)
+        def lazy(*call_args, **call_kwargs):
+            nonlocal compiled
+            if compiled is None:
+                from numba import njit as numba_njit
+                compiled = numba_njit(**kwargs)(fn)
+            return compiled(*call_args, **call_kwargs)
+        return lazy
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return decorate(args[0])
+    return decorate
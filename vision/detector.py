@@ -16,6 +16,8 @@ Performance targets:
 import time
 import threading
 import queue
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -35,6 +37,12 @@ except ImportError:
     YOLO_AVAILABLE = False
     log.warning("Ultralytics not installed — YOLO detection disabled. Run: pip install ultralytics")
 
+try:
+    import onnxruntime  # noqa: F401 — backend for Ultralytics' .onnx models
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 
 # ── Device Detection ──────────────────────────────────────────────────────────
 
@@ -61,6 +69,8 @@ def detect_best_device() -> str:
 
 class Detection:
     """A single detected object."""
+    __slots__ = ("class_id", "class_name", "confidence", "bbox")
+
     def __init__(self, class_id: int, class_name: str, confidence: float, bbox: tuple):
         self.class_id = class_id
         self.class_name = class_name
@@ -122,9 +132,19 @@ class YOLODetector:
     
     def __init__(self):
         self.model = None
+        self.backend = "torch"
         self.device = detect_best_device()
         self.is_loaded = False
         self._result_cache: dict[str, DetectionResult] = {}
+        # Single inference slot: at most one batch runs at a time, extra
+        # requests are dropped rather than queued behind a slow model
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yolo")
+        self._inflight: Optional[Future] = None
+        # Own lock: the class-level _lock is held during (slow) model loads
+        self._submit_lock = threading.Lock()
+        # Reused model input buffers, one per frame shape: (batch, H, W, 3) BGR
+        self._in_bufs: dict[tuple[int, int], np.ndarray] = {}
+        self._infer_lock = threading.Lock()
         self._load_model()
     
     @classmethod
@@ -144,7 +164,7 @@ class YOLODetector:
         
         try:
             log.info(f"Loading YOLO model: {settings.YOLO_MODEL_NAME} on {self.device}")
-            self.model = YOLO(settings.YOLO_MODEL_NAME)
+            self.model = self._load_weights()
             # Warm up
             dummy = np.zeros((640, 640, 3), dtype=np.uint8)
             self.model(dummy, device=self.device, verbose=False)
@@ -154,6 +174,57 @@ class YOLODetector:
             log.error(f"Failed to load YOLO model: {e}")
             self.is_loaded = False
     
+    def _load_weights(self):
+        """
+        Load the YOLO weights, preferring ONNX Runtime on CPU.
+        
+        The PyTorch checkpoint is exported to ONNX once and cached next to it;
+        ONNX Runtime's fused CPU kernels are markedly faster than eager
+        PyTorch for YOLOv8n. Falls back to PyTorch if anything goes wrong.
+        """
+        model = YOLO(settings.YOLO_MODEL_NAME)
+        if self.device != "cpu" or not settings.YOLO_CPU_ONNX or not ONNX_AVAILABLE:
+            return model
+        
+        onnx_path = Path(settings.YOLO_MODEL_NAME).with_suffix(".onnx")
+        try:
+            if not onnx_path.exists():
+                log.info(f"Exporting {settings.YOLO_MODEL_NAME} to ONNX for CPU inference")
+                onnx_path = Path(model.export(
+                    format="onnx",
+                    imgsz=settings.YOLO_IMG_SIZE,
+                    dynamic=True,   # camera grid runs variable-size batches
+                ))
+            onnx_model = YOLO(str(onnx_path), task="detect")
+            self.backend = "onnx"
+            return onnx_model
+        except Exception as e:
+            log.warning(f"ONNX export/load failed — using PyTorch weights: {e}")
+            return model
+    
+    def warmup(self, batch_size: int = 1, size: tuple[int, int] = (640, 360)):
+        """
+        Run a throwaway forward pass at the shape real frames will use.
+        
+        The first call at a new batch shape pays for kernel selection /
+        autotuning and lazy device allocations; doing it here keeps that stall
+        out of the first user-visible camera frame.
+        """
+        if not self.is_loaded or self.model is None:
+            return
+        try:
+            w, h = size
+            dummies = [np.zeros((h, w, 3), dtype=np.uint8)] * batch_size
+            self.model(
+                dummies,
+                device=self.device,
+                imgsz=settings.YOLO_IMG_SIZE,
+                verbose=False,
+            )
+            log.info(f"YOLO warm-up done (batch={batch_size}, {w}x{h})")
+        except Exception as e:
+            log.warning(f"YOLO warm-up failed: {e}")
+    
     def detect(self, image: Image.Image, camera_id: str = "default") -> DetectionResult:
         """
         Run object detection on a PIL image.
@@ -165,51 +236,113 @@ class YOLODetector:
         Returns:
             DetectionResult with annotated image and detection list
         """
+        return self.detect_batch([image], [camera_id])[0]
+    
+    def detect_batch(self, images: list[Image.Image], camera_ids: list[str]) -> list[DetectionResult]:
+        """
+        Run object detection on several frames with a single model call.
+        
+        The predictor has a fixed per-call cost (pre/post-processing setup,
+        kernel launches), so one batched call for the whole camera grid is
+        much cheaper than one call per camera.
+        
+        Args:
+            images:     PIL Images (RGB), one per camera
+            camera_ids: Camera IDs matching ``images``, used for per-camera caching
+        
+        Returns:
+            DetectionResult per input image, in the same order
+        """
+        if not images:
+            return []
         if not self.is_loaded or self.model is None:
-            return self._passthrough_result(image)
+            return [self._passthrough_result(img) for img in images]
         
         start = time.time()
         
         try:
-            img_array = np.array(image)
-            results = self.model(
-                img_array,
-                device=self.device,
-                conf=settings.YOLO_CONFIDENCE,
-                iou=settings.YOLO_IOU_THRESHOLD,
-                imgsz=settings.YOLO_IMG_SIZE,
-                verbose=False,
-            )
-            
+            with self._infer_lock:
+                results = self.model(
+                    self._prepare_inputs(images),
+                    device=self.device,
+                    conf=settings.YOLO_CONFIDENCE,
+                    iou=settings.YOLO_IOU_THRESHOLD,
+                    imgsz=settings.YOLO_IMG_SIZE,
+                    verbose=False,
+                )
+        except Exception as e:
+            log.error(f"YOLO inference error: {e}")
+            return [self._passthrough_result(img) for img in images]
+        
+        # Report each frame's share of the batched call
+        inference_ms = (time.time() - start) * 1000 / len(images)
+        
+        det_results = []
+        for image, camera_id, result in zip(images, camera_ids, results):
             detections = []
-            result = results[0]
-            
             for box in result.boxes:
                 class_id = int(box.cls[0].item())
                 confidence = float(box.conf[0].item())
                 x1, y1, x2, y2 = [int(v) for v in box.xyxy[0].tolist()]
                 class_name = result.names.get(class_id, str(class_id))
-                
-                # Filter to classes of interest (or show all)
                 detections.append(Detection(class_id, class_name, confidence, (x1, y1, x2, y2)))
             
-            inference_ms = (time.time() - start) * 1000
-            annotated = self._draw_detections(image.copy(), detections)
-            anomalies = self._check_anomalies(detections, image.size)
-            
             det_result = DetectionResult(
                 detections=detections,
-                annotated_image=annotated,
+                annotated_image=self._draw_detections(image.copy(), detections),
                 inference_ms=inference_ms,
-                anomalies=anomalies,
+                anomalies=self._check_anomalies(detections, image.size),
                 is_live=True,
             )
             self._result_cache[camera_id] = det_result
-            return det_result
+            det_results.append(det_result)
         
-        except Exception as e:
-            log.error(f"YOLO inference error: {e}")
-            return self._passthrough_result(image)
+        return det_results
+    
+    def _prepare_inputs(self, images: list[Image.Image]) -> list[np.ndarray]:
+        """
+        Convert frames to BGR arrays inside a reused per-shape buffer.
+        Must be called with ``_infer_lock`` held — the views alias the buffer.
+        """
+        inputs = []
+        for i, img in enumerate(images):
+            w, h = img.size
+            buf = self._in_bufs.get((h, w))
+            if buf is None or buf.shape[0] < len(images):
+                buf = np.empty((max(len(images), settings.CAMERA_GRID_MAX), h, w, 3), dtype=np.uint8)
+                self._in_bufs[(h, w)] = buf
+            # Ultralytics reads arrays as BGR; it letterboxes and normalises itself
+            np.copyto(buf[i], np.asarray(img.convert("RGB"))[..., ::-1])
+            inputs.append(buf[i])
+        return inputs
+    
+    def submit_batch(self, images: list[Image.Image], camera_ids: list[str]) -> Optional[Future]:
+        """
+        Queue a batch for background detection unless one is already running.
+        
+        Returns:
+            Future resolving to the list of DetectionResults, or None if the
+            model is still busy with a previous batch (the frames are skipped)
+        """
+        with self._submit_lock:
+            if self._inflight is not None and not self._inflight.done():
+                return None
+            self._inflight = self._executor.submit(self.detect_batch, images, camera_ids)
+            return self._inflight
+    
+    def latest_result(self, camera_id: str) -> Optional[DetectionResult]:
+        """Most recent detection result for a camera, if any."""
+        return self._result_cache.get(camera_id)
+    
+    def overlay(self, result: DetectionResult, image: Image.Image) -> DetectionResult:
+        """Re-draw an earlier frame's detections on a newer frame."""
+        return DetectionResult(
+            detections=result.detections,
+            annotated_image=self._draw_detections(image.copy(), result.detections),
+            inference_ms=result.inference_ms,
+            anomalies=result.anomalies,
+            is_live=result.is_live,
+        )
     
     def _draw_detections(self, image: Image.Image, detections: list[Detection]) -> Image.Image:
         """Draw bounding boxes and labels on image."""
@@ -313,4 +446,4 @@ class YOLODetector:
     @property
     def device_info(self) -> str:
         status = "✓ Loaded" if self.is_loaded else "✗ Not loaded"
-        return f"{settings.YOLO_MODEL_NAME} on {self.device} — {status}"
+        return f"{settings.YOLO_MODEL_NAME} ({self.backend}) on {self.device} — {status}"